@@ -213,6 +213,14 @@ class ZApp:
             self.stop_thread.set()
             self.newline_thread.join(1.0)  # Wait up to 1 second for thread to finish
         
+        # Fold completions logged from the task list into the CSV
+        if hasattr(self, 'task_list_display') and self.task_list_display:
+            self.task_list_display.compact_completions(wait=True)
+        
+        # Write any word information still waiting to be saved
+        if hasattr(self, 'word_info') and self.word_info:
+            self.word_info.flush_word_data()
+        
         # Try to recover any temp entries before closing
         try:
             self.data_manager.recover_temp_entries()
@@ -1,8 +1,6 @@
 import json
 import os
 import sys
-import tkinter as tk
-from tkinter import messagebox
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
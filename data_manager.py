@@ -83,6 +83,8 @@ class DataManager:
             if not os.path.exists(self.csv_filename):
                 self.ensure_csv_exists()
             
+            row = [timestamp, text, task if task is not None else '']
+            
             # Check if CSV has task column
             try:
                 df = pd.read_csv(self.csv_filename)
@@ -90,6 +92,9 @@ class DataManager:
                     # Add task column header without populating values
                     df['task'] = None
                     df.to_csv(self.csv_filename, index=False)
+                
+                # Leave any further columns (e.g. completed) empty, so every row has the header's width
+                row += [''] * (len(df.columns) - len(row))
             except Exception:
                 # File might be empty or not exist, handled by the write operation below
                 pass
@@ -97,7 +102,7 @@ class DataManager:
             # Try to write to main CSV
             with open(self.csv_filename, 'a', newline='') as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow([timestamp, text, task if task is not None else ''])
+                writer.writerow(row)
             
             # If we get here, writing was successful
             return True
@@ -149,6 +154,12 @@ class DataManager:
             total_recovered = 0
             recovered_files = 0
             
+            # Recovered entries only carry a timestamp and text - leave the main CSV's other columns empty
+            padding = []
+            if os.path.exists(self.csv_filename):
+                with open(self.csv_filename, 'r', newline='') as csvfile:
+                    padding = [''] * max(len(next(csv.reader(csvfile), [])) - 2, 0)
+            
             # Process each temp file
             for temp_file in temp_files:
                 temp_filepath = os.path.join(self.temp_dir, temp_file)
@@ -165,10 +176,9 @@ class DataManager:
                     # Write the entries to the main CSV
                     with open(self.csv_filename, 'a', newline='') as csvfile:
                         writer = csv.writer(csvfile)
-                        
-                        for _, row in temp_df.iterrows():
-                            writer.writerow([row['timestamp'], row['text']])
-                            total_recovered += 1
+                        entries = zip(temp_df['timestamp'].to_numpy(), temp_df['text'].to_numpy())
+                        writer.writerows([timestamp, text, *padding] for timestamp, text in entries)
+                        total_recovered += len(temp_df)
                     
                     # Remove the temp file after successful recovery
                     os.remove(temp_filepath)
@@ -8,13 +8,15 @@ import os
 import re
 import json
 from datetime import datetime
-import tkinter as tk
-from tkinter import simpledialog, messagebox
 
 
 # Windows disallowed characters in filenames
 INVALID_CHARS = r'[<>:"/\\|?*]'
 
+# Sentinel next to a CSV holding its header line, written once the file has been
+# rewritten with that header - every row then has the header's number of fields
+SCHEMA_SENTINEL_SUFFIX = ".schema_ok"
+
 
 def validate_filename(filename):
     """
@@ -66,6 +68,9 @@ def prompt_for_filename(parent, title="Enter Filename", message="Please enter a
     Returns:
         str or None: Valid filename with .csv extension or None if canceled
     """
+    # Imported here so non-GUI users of this module don't load tkinter
+    from tkinter import simpledialog, messagebox
+    
     while True:
         filename = simpledialog.askstring(title, message, parent=parent)
         
@@ -189,4 +194,47 @@ def backup_file(filepath, backup_dir=None):
         return backup_path
     except Exception as e:
         print(f"Error creating backup: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def read_header_line(csv_path):
+    """
+    Read the raw header line of a CSV file.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+        
+    Returns:
+        bytes: Header line without its line ending
+    """
+    with open(csv_path, 'rb') as f:
+        return f.readline().rstrip(b'\r\n')
+
+
+def schema_matches(csv_path):
+    """
+    Check whether a CSV still has the header it was last rewritten with.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+        
+    Returns:
+        bool: True if the sentinel matches the CSV's header
+    """
+    try:
+        with open(csv_path + SCHEMA_SENTINEL_SUFFIX, 'rb') as f:
+            return f.read() == read_header_line(csv_path)
+    except OSError:
+        return False
+
+
+def mark_schema(csv_path):
+    """
+    Record a CSV's header in its sentinel after every row was written to the header's width.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+    """
+    header = read_header_line(csv_path)
+    with open(csv_path + SCHEMA_SENTINEL_SUFFIX, 'wb') as f:
+        f.write(header)
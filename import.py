@@ -1,6 +1,7 @@
 import re
 import os
 import csv
+from operator import itemgetter
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
@@ -45,6 +46,12 @@ except ConfigError as e:
     CONFIG_ERROR = str(e)
     root.deiconify()  # Show the root for user input
 
+# Import line format: 2025-02-22 SAT 18:21:52.25 ~ text content
+_ENTRY_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}\s+[A-Z]{3}\s+\d{2}:\d{2}:\d{2}\.\d{2})\s+~\s+(.+)$')
+
+# Write buffer for CSV output (1 MiB) - keeps large imports to a few write syscalls
+CSV_BUFFER_SIZE = 1 << 20
+
 class ZImporter:
     def __init__(self, root):
         self.root = root
@@ -169,6 +176,50 @@ class ZImporter:
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
     
+    def read_max_timestamp(self, csv_filename):
+        """
+        Read the greatest timestamp recorded in the CSV's ".maxts" marker.
+        
+        The marker also stores the CSV's size and mtime at the time it was written;
+        if the CSV has changed since (e.g. the main app appended an entry) the
+        marker is stale and None is returned.
+        
+        Args:
+            csv_filename (str): Path to the CSV file
+            
+        Returns:
+            str: Greatest timestamp in the CSV, or None if unknown
+        """
+        try:
+            with open(csv_filename + ".maxts", 'r', encoding='utf-8') as f:
+                max_ts, size, mtime_ns = f.read().split('\n')[:3]
+            
+            st = os.stat(csv_filename)
+            if st.st_size != int(size) or st.st_mtime_ns != int(mtime_ns):
+                return None
+            return max_ts
+        except Exception:
+            return None
+    
+    def write_max_timestamp(self, csv_filename, max_ts):
+        """
+        Record the greatest timestamp of the CSV in its ".maxts" marker.
+        
+        Args:
+            csv_filename (str): Path to the CSV file
+            max_ts (str): Greatest timestamp now in the CSV
+        """
+        marker_path = csv_filename + ".maxts"
+        try:
+            st = os.stat(csv_filename)
+            tmp_path = marker_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(f"{max_ts}\n{st.st_size}\n{st.st_mtime_ns}\n")
+            os.replace(tmp_path, marker_path)
+        except Exception as e:
+            # The marker is only an optimization - next import falls back to a full merge
+            self.log(f"Could not update timestamp marker: {str(e)}")
+    
     def import_data(self):
         """Process the selected file and import data to CSV"""
         if not self.file_path:
@@ -182,7 +233,7 @@ class ZImporter:
             csv_exists = os.path.exists(csv_filename)
             if not csv_exists:
                 try:
-                    with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+                    with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
                         writer = csv.writer(csvfile)
                         writer.writerow(['timestamp', 'text'])
                     self.log(f"Created new CSV file: {DATA_CSV}")
@@ -217,7 +268,7 @@ class ZImporter:
                             
                             # Try to create the new file
                             try:
-                                with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+                                with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
                                     writer = csv.writer(csvfile)
                                     writer.writerow(['timestamp', 'text'])
                                 
@@ -238,27 +289,20 @@ class ZImporter:
             with open(self.file_path, 'r', encoding='utf-8') as file:
                 lines = file.readlines()
             
-            # Parse lines using regex
-            # Format: 2025-02-22 SAT 18:21:52.25 ~ text content
-            pattern = r'^(\d{4}-\d{2}-\d{2}\s+[A-Z]{3}\s+\d{2}:\d{2}:\d{2}\.\d{2})\s+~\s+(.+)$'
+            # Parse all lines in one vectorized pass (see _ENTRY_RE for the format)
+            lines = pd.Series(lines, dtype=object).str.strip()
+            lines = lines[lines != '']  # Skip empty lines
             
-            entries = []
-            skipped = 0
+            extracted = lines.str.extract(_ENTRY_RE)
+            valid_mask = extracted[0].notna()
+            skipped = int((~valid_mask).sum())
             
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
-                    
-                match = re.match(pattern, line)
-                if match:
-                    timestamp = match.group(1)
-                    text = match.group(2)
-                    entries.append([timestamp, text])
-                    self.log(f"Line {line_num}: Parsed successfully")
-                else:
-                    skipped += 1
-                    self.log(f"Line {line_num}: Invalid format, skipped")
+            # Index is the 0-based position in the file
+            for line_num in lines.index[~valid_mask] + 1:
+                self.log(f"Line {line_num}: Invalid format, skipped")
+            
+            entries = extracted[valid_mask].values.tolist()
+            self.log(f"Parsed {len(entries)} lines successfully")
             
             if not entries:
                 messagebox.showwarning("No Valid Entries", "No valid entries found in the file.")
@@ -271,7 +315,10 @@ class ZImporter:
             # Create a temp directory for backups
             temp_dir = file_helper.setup_temp_directory()
             
-            # Sort entries if option is selected
+            # Sort entries if option is selected.
+            # Timestamps are fixed-width ("YYYY-MM-DD DAY HH:MM:SS.ff") so plain string
+            # order is chronological order - sort on the raw string, do NOT convert to
+            # datetime (a per-row strptime would dominate the import time).
             sort_entries = self.sort_var.get()
             if sort_entries:
                 self.log("Sorting entries by timestamp...")
@@ -280,29 +327,51 @@ class ZImporter:
                     # If CSV already exists, read it first
                     if csv_exists:
                         try:
-                            # Create a backup of the original file
-                            backup_filename = os.path.join(temp_dir, f"backup_{DATA_CSV}_{file_helper.generate_temp_filename()}")
-                            import shutil
-                            shutil.copy2(csv_filename, backup_filename)
-                            self.log(f"Created backup at: {backup_filename}")
-                            
-                            # Read existing file
-                            df_existing = pd.read_csv(csv_filename)
-                            
-                            # Convert entries to DataFrame
-                            df_new = pd.DataFrame(entries, columns=['timestamp', 'text'])
-                            
-                            # Combine existing and new data
-                            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-                            
-                            # Sort by timestamp
-                            df_combined = df_combined.sort_values('timestamp')
-                            
-                            # Write back to CSV
-                            df_combined.to_csv(csv_filename, index=False)
+                            entries.sort(key=itemgetter(0))
+                            max_ts = self.read_max_timestamp(csv_filename)
                             
-                            self.log(f"Added {len(entries)} entries to existing CSV file")
-                            self.log(f"Total entries after import: {len(df_combined)}")
+                            if max_ts is not None and entries[0][0] > max_ts:
+                                # Every new entry sorts after the existing data, so a
+                                # plain append keeps the file sorted - no need to read it.
+                                # Pad the rows to the header's width (e.g. empty task and
+                                # completed flags) so every row has the same field count
+                                with open(csv_filename, 'r', newline='', encoding='utf-8') as csvfile:
+                                    header = next(csv.reader(csvfile), [])
+                                padding = [''] * max(len(header) - 2, 0)
+                                
+                                with open(csv_filename, 'a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+                                    writer = csv.writer(csvfile)
+                                    writer.writerows(entry + padding for entry in entries)
+                                
+                                self.write_max_timestamp(csv_filename, entries[-1][0])
+                                self.log(f"Appended {len(entries)} entries to existing CSV file")
+                            else:
+                                # Create a backup of the original file
+                                backup_filename = os.path.join(temp_dir, f"backup_{DATA_CSV}_{file_helper.generate_temp_filename()}")
+                                import shutil
+                                shutil.copy2(csv_filename, backup_filename)
+                                self.log(f"Created backup at: {backup_filename}")
+                                
+                                # Read existing file
+                                df_existing = pd.read_csv(csv_filename)
+                                
+                                # Convert entries to DataFrame
+                                df_new = pd.DataFrame(entries, columns=['timestamp', 'text'])
+                                
+                                # Combine existing and new data
+                                df_combined = pd.concat([df_existing, df_new], ignore_index=True)
+                                
+                                # Sort by timestamp
+                                df_combined = df_combined.sort_values('timestamp')
+                                
+                                # Write back to CSV via a temp file so a crash can't truncate the original
+                                tmp_filename = csv_filename + ".tmp"
+                                df_combined.to_csv(tmp_filename, index=False)
+                                os.replace(tmp_filename, csv_filename)
+                                
+                                self.write_max_timestamp(csv_filename, df_combined['timestamp'].dropna().astype(str).max())
+                                self.log(f"Added {len(entries)} entries to existing CSV file")
+                                self.log(f"Total entries after import: {len(df_combined)}")
                             
                         except Exception as e:
                             self.log(f"Error processing existing CSV: {str(e)}")
@@ -322,13 +391,16 @@ class ZImporter:
                             return
                     else:
                         # If CSV doesn't exist or couldn't be read, create new
-                        entries.sort(key=lambda x: x[0])  # Sort by timestamp
+                        entries.sort(key=itemgetter(0))  # Sort by timestamp
                         
-                        with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
+                        tmp_filename = csv_filename + ".tmp"
+                        with open(tmp_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
                             writer = csv.writer(csvfile)
                             writer.writerow(['timestamp', 'text'])  # Header
                             writer.writerows(entries)
+                        os.replace(tmp_filename, csv_filename)
                         
+                        self.write_max_timestamp(csv_filename, entries[-1][0])
                         self.log(f"Created new CSV file with {len(entries)} sorted entries")
                 except Exception as e:
                     self.log(f"Error during import: {str(e)}")
@@ -337,10 +409,10 @@ class ZImporter:
                     temp_filepath = os.path.join(temp_dir, file_helper.generate_temp_filename())
                     
                     try:
-                        with open(temp_filepath, 'w', newline='', encoding='utf-8') as csvfile:
+                        with open(temp_filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
                             writer = csv.writer(csvfile)
                             writer.writerow(['timestamp', 'text'])  # Header
-                            writer.writerows(sorted(entries, key=lambda x: x[0]))
+                            writer.writerows(sorted(entries, key=itemgetter(0)))
                         
                         self.log(f"Error importing to main file. Data saved to: {temp_filepath}")
                         messagebox.showwarning(
@@ -358,14 +430,22 @@ class ZImporter:
                 # Append to existing or create new without sorting
                 try:
                     mode = 'a' if csv_exists else 'w'
-                    with open(csv_filename, mode, newline='', encoding='utf-8') as csvfile:
+                    
+                    # Pad the rows to an existing header's width, as the sorted append does
+                    padding = []
+                    if csv_exists:
+                        with open(csv_filename, 'r', newline='', encoding='utf-8') as csvfile:
+                            header = next(csv.reader(csvfile), [])
+                        padding = [''] * max(len(header) - 2, 0)
+                    
+                    with open(csv_filename, mode, newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
                         writer = csv.writer(csvfile)
                         
                         # Write header if new file
                         if not csv_exists:
                             writer.writerow(['timestamp', 'text'])
                             
-                        writer.writerows(entries)
+                        writer.writerows(entry + padding for entry in entries)
                     
                     self.log(f"Added {len(entries)} entries to CSV (unsorted)")
                 except Exception as e:
@@ -375,7 +455,7 @@ class ZImporter:
                     temp_filepath = os.path.join(temp_dir, file_helper.generate_temp_filename())
                     
                     try:
-                        with open(temp_filepath, 'w', newline='', encoding='utf-8') as csvfile:
+                        with open(temp_filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
                             writer = csv.writer(csvfile)
                             writer.writerow(['timestamp', 'text'])  # Header
                             writer.writerows(entries)
@@ -8,6 +8,10 @@ import os
 import json
 
 
+# Settings file lives next to this module
+_SETTINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "multiline_settings.json")
+
+
 class MultilineHandler:
     """
     Handles multiline text input for the Z application.
@@ -35,6 +39,16 @@ class MultilineHandler:
         
         # Initialize buffer for multiline content
         self.buffer = []
+        
+        # Subcommand handlers for /ml
+        self._subcmds = {
+            "submit": self._cmd_submit,
+            "cancel": self._cmd_cancel,
+            "show": self._cmd_show,
+            "lines": self._cmd_lines,
+            "preserve": self._cmd_preserve,
+            "status": self._cmd_status
+        }
     
     def load_settings(self):
         """
@@ -49,14 +63,10 @@ class MultilineHandler:
             "buffer_limit": 100  # Prevent excessive buffer growth
         }
         
-        # Get the directory where the script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        settings_path = os.path.join(script_dir, "multiline_settings.json")
-        
         # Try to load settings
         try:
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
+            if os.path.exists(_SETTINGS_PATH):
+                with open(_SETTINGS_PATH, 'r', encoding='utf-8') as f:
                     loaded_settings = json.load(f)
                 
                 # Update default settings with loaded values
@@ -68,12 +78,13 @@ class MultilineHandler:
     
     def save_settings(self):
         """Save current settings to the config file"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        settings_path = os.path.join(script_dir, "multiline_settings.json")
-        
         try:
-            with open(settings_path, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            # Compact output - the settings dict is small and rewritten on every toggle.
+            # Write to a temp file and swap it in so a crash never leaves a truncated file.
+            tmp_path = _SETTINGS_PATH + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.settings, f, separators=(',', ':'))
+            os.replace(tmp_path, _SETTINGS_PATH)
         except Exception as e:
             self.app.error_handler.log_error(f"Error saving multiline settings: {e}")
     
@@ -233,73 +244,75 @@ class MultilineHandler:
         subcmd = parts[0].lower()
         subcmd_args = parts[1] if len(parts) > 1 else ""
         
-        # Submit buffer
-        if subcmd == "submit":
-            if not self.is_active():
-                return "Multiline mode is not active. Use /ml to enable it."
-            
-            content = self.submit_buffer()
-            self.toggle_active()  # Disable multiline mode
-            
-            if content:
-                return f"Submitted multiline content ({len(self.render_multiline_text(content).splitlines())} lines)"
-            else:
-                return "No content to submit."
+        # Dispatch to the subcommand handler
+        handler = self._subcmds.get(subcmd)
+        if handler is None:
+            return "Unknown multiline command. Available commands: submit, cancel, show, lines, preserve, status"
+        return handler(subcmd_args)
+    
+    def _cmd_submit(self, args):
+        """Submit the buffer and leave multiline mode."""
+        if not self.is_active():
+            return "Multiline mode is not active. Use /ml to enable it."
         
-        # Cancel and clear buffer
-        elif subcmd == "cancel":
-            if not self.is_active():
-                return "Multiline mode is not active."
-            
-            self.clear_buffer()
-            self.toggle_active()  # Disable multiline mode
-            return "Multiline input canceled."
-        
-        # Show current buffer
-        elif subcmd == "show":
-            if not self.is_active():
-                return "Multiline mode is not active. Use /ml to enable it."
-            
-            content = self.get_buffer_content()
-            if content:
-                return f"Current buffer:\n{self.render_multiline_text(content)}"
-            else:
-                return "Buffer is empty."
-        
-        # Set number of lines
-        elif subcmd == "lines":
-            try:
-                lines = int(subcmd_args)
-                new_lines = self.set_lines(lines)
-                return f"Multiline lines set to {new_lines}."
-            except ValueError:
-                return f"Invalid line count. Current setting: {self.settings['lines']} lines."
-        
-        # Set preserve newlines setting
-        elif subcmd == "preserve":
-            value = subcmd_args.lower()
-            
-            if value in ["on", "true", "yes", "1"]:
-                self.set_preserve_newlines(True)
-                return "Newlines will be preserved in multiline input."
-            elif value in ["off", "false", "no", "0"]:
-                self.set_preserve_newlines(False)
-                return "Newlines will be flattened to spaces in multiline input."
-            else:
-                current = "on" if self.settings["preserve_newlines"] else "off"
-                return f"Invalid value. Use 'on' or 'off'. Current setting: {current}"
-        
-        # Show status
-        elif subcmd == "status":
-            mode = "active" if self.is_active() else "inactive"
-            preserve = "preserved" if self.settings["preserve_newlines"] else "flattened to spaces"
-            buffer_size = len(self.buffer)
-            
-            return f"Multiline mode is {mode}\n" + \
-                   f"Lines: {self.settings['lines']}\n" + \
-                   f"Newlines are {preserve}\n" + \
-                   f"Buffer contains {buffer_size} lines"
+        content = self.submit_buffer()
+        self.toggle_active()  # Disable multiline mode
+        
+        if content:
+            return f"Submitted multiline content ({len(self.render_multiline_text(content).splitlines())} lines)"
+        else:
+            return "No content to submit."
+    
+    def _cmd_cancel(self, args):
+        """Discard the buffer and leave multiline mode."""
+        if not self.is_active():
+            return "Multiline mode is not active."
+        
+        self.clear_buffer()
+        self.toggle_active()  # Disable multiline mode
+        return "Multiline input canceled."
+    
+    def _cmd_show(self, args):
+        """Show the current buffer."""
+        if not self.is_active():
+            return "Multiline mode is not active. Use /ml to enable it."
         
-        # Unknown subcommand
+        content = self.get_buffer_content()
+        if content:
+            return f"Current buffer:\n{self.render_multiline_text(content)}"
         else:
-            return "Unknown multiline command. Available commands: submit, cancel, show, lines, preserve, status"
\ No newline at end of file
+            return "Buffer is empty."
+    
+    def _cmd_lines(self, args):
+        """Set the number of display lines."""
+        try:
+            lines = int(args)
+            new_lines = self.set_lines(lines)
+            return f"Multiline lines set to {new_lines}."
+        except ValueError:
+            return f"Invalid line count. Current setting: {self.settings['lines']} lines."
+    
+    def _cmd_preserve(self, args):
+        """Set whether newlines are preserved."""
+        value = args.lower()
+        
+        if value in ["on", "true", "yes", "1"]:
+            self.set_preserve_newlines(True)
+            return "Newlines will be preserved in multiline input."
+        elif value in ["off", "false", "no", "0"]:
+            self.set_preserve_newlines(False)
+            return "Newlines will be flattened to spaces in multiline input."
+        else:
+            current = "on" if self.settings["preserve_newlines"] else "off"
+            return f"Invalid value. Use 'on' or 'off'. Current setting: {current}"
+    
+    def _cmd_status(self, args):
+        """Show multiline mode status."""
+        mode = "active" if self.is_active() else "inactive"
+        preserve = "preserved" if self.settings["preserve_newlines"] else "flattened to spaces"
+        buffer_size = len(self.buffer)
+        
+        return f"Multiline mode is {mode}\n" + \
+               f"Lines: {self.settings['lines']}\n" + \
+               f"Newlines are {preserve}\n" + \
+               f"Buffer contains {buffer_size} lines"
@@ -1,9 +1,30 @@
 import pandas as pd
+import numpy as np
 import os
+import re
 import sys
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import tkinter as tk
-from tkinter import messagebox, simpledialog
+
+# ciso8601 is optional - a C parser that is much faster than strptime
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# pyarrow is optional - its CSV reader parses on multiple threads
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# numba is optional - it compiles the gap-counting loop for very large files
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Import helper for file operations
 try:
@@ -25,6 +46,7 @@ except ConfigError as e:
     
     # Try to handle this with a GUI if possible
     try:
+        import tkinter as tk
         root = tk.Tk()
         root.withdraw()
         
@@ -64,7 +86,263 @@ except ConfigError as e:
         print("Please run the main Z application to configure the system.")
         sys.exit(1)
 
-def generate_temp_file(csv_filename=None, output_filename=None, time_interval=None):
+# Write buffer for the temp file output (1 MiB)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Line ending text mode would have written, so binary output stays byte-identical
+_LINESEP = os.linesep.encode('ascii')
+
+# Prebuilt newline runs for the common small gaps between entries
+_NL_CACHE_SIZE = 256
+_NL_CACHE = ['\n' * i for i in range(_NL_CACHE_SIZE)]
+
+# Date and time tokens of a Z timestamp, skipping the weekday in between
+_TS_RE = re.compile(r'\s*(\S+)\s+\S+\s+(\S+)')
+
+# Hidden Tk root shared by popups when the caller has no Tk root of its own
+_popup_root = None
+
+def show_popup(kind, title, message):
+    """
+    Show a messagebox popup, if a display is available.
+    
+    When called from a running Tk application its root is used as the parent;
+    otherwise a hidden root is created on first use and kept for later popups,
+    rather than creating and destroying a Tk root for every message.
+    
+    Parameters:
+    - kind: Name of the messagebox function, e.g. "showerror"
+    - title: Popup title
+    - message: Popup message
+    """
+    global _popup_root
+    try:
+        import tkinter as tk
+        from tkinter import messagebox
+        
+        parent = tk._default_root
+        if parent is None:
+            if _popup_root is None:
+                _popup_root = tk.Tk()
+                _popup_root.withdraw()
+            parent = _popup_root
+        
+        getattr(messagebox, kind)(title, message, parent=parent)
+    except:
+        pass
+
+def parse_timestamp(ts_str):
+    """
+    Parse a single Z timestamp such as "2025-02-24 MON 14:30:45.123".
+    
+    Used for rows the vectorized parse in generate_temp_file rejects.
+    
+    Parameters:
+    - ts_str: Timestamp string
+    
+    Returns:
+    - datetime: Parsed timestamp, or None if parsing fails
+    """
+    try:
+        # Remove weekday abbreviation
+        date_part, time_part = _TS_RE.match(ts_str).groups()
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime_as_naive(f"{date_part}T{time_part}")
+        return datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M:%S.%f")
+    except Exception:
+        # Return None if parsing fails
+        return None
+
+def prepare_entries(df):
+    """
+    Drop entries without text and parse the timestamps of the rest.
+    
+    Parameters:
+    - df: DataFrame with 'timestamp' and 'text' columns
+    
+    Returns:
+    - DataFrame: The entries with a parsed 'datetime' column; rows with empty
+      text or invalid timestamps are removed
+    """
+    # Filter out rows with empty text
+    df = df.dropna(subset=['text'])
+    df = df[df['text'].to_numpy() != '']
+    
+    # Parse timestamps
+    # Format: "2025-02-24 MON 14:30:45.123" - drop the weekday abbreviation, then
+    # parse the whole column at once; unparseable timestamps become NaT
+    timestamps = df['timestamp'].str.replace(r'\s[A-Z]{3}\s', ' ', regex=True)
+    df = df.assign(datetime=pd.to_datetime(timestamps, format="%Y-%m-%d %H:%M:%S.%f", errors='coerce', cache=True))
+    
+    # Give rows that don't match the exact format a second, per-row attempt
+    unparsed = df['datetime'].isna() & df['timestamp'].notna()
+    if unparsed.any():
+        # Parse each distinct string once - bursts of entries often share a timestamp
+        retry = df.loc[unparsed, 'timestamp']
+        parsed = {ts: parse_timestamp(ts) for ts in retry.unique()}
+        df.loc[unparsed, 'datetime'] = pd.to_datetime(retry.map(parsed))
+    
+    # Remove rows with invalid timestamps
+    return df[df['datetime'].notna()]
+
+def _gap_counts_numpy(ts_ns, step_ns, first_gap):
+    """
+    Count the newlines to put before each entry.
+    
+    Parameters:
+    - ts_ns: int64 array of entry timestamps in nanoseconds
+    - step_ns: Time interval in nanoseconds
+    - first_gap: Newline count for the first entry
+    
+    Returns:
+    - ndarray: int64 newline count for every entry
+    """
+    gaps = np.empty(len(ts_ns), dtype=np.int64)
+    gaps[0] = first_gap
+    gaps[1:] = np.diff(ts_ns) // step_ns
+    # Out-of-order timestamps give negative gaps, which mean no newlines
+    np.maximum(gaps, 0, out=gaps)
+    return gaps
+
+if njit is not None:
+    @njit(cache=True)
+    def _gap_counts_jit(ts_ns, step_ns, first_gap):
+        # Same as _gap_counts_numpy in a single compiled pass, without the temporary np.diff array
+        gaps = np.empty(ts_ns.size, dtype=np.int64)
+        gaps[0] = first_gap
+        for i in range(1, ts_ns.size):
+            gap = (ts_ns[i] - ts_ns[i - 1]) // step_ns
+            gaps[i] = gap if gap > 0 else 0
+        return gaps
+    
+    gap_counts = _gap_counts_jit
+else:
+    gap_counts = _gap_counts_numpy
+
+def render_entries(df, time_interval, prev_ns=None):
+    """
+    Render the entries of a DataFrame as the temp file's text.
+    
+    Entries are concatenated in order, with one newline between two entries for
+    every whole multiple of time_interval seconds separating their timestamps.
+    
+    Parameters:
+    - df: Non-empty DataFrame with 'text' and 'datetime' columns (no missing timestamps)
+    - time_interval: Time interval in seconds for adding newlines between entries
+    - prev_ns: Timestamp (int64 nanoseconds) of the entry written just before df, if any
+    
+    Returns:
+    - str: The rendered text
+    - int: Timestamp of the last entry in nanoseconds, to pass as the next prev_ns
+    """
+    # Timestamps as int64 nanoseconds, so gaps are plain integer arithmetic
+    ts_ns = df['datetime'].to_numpy(dtype='datetime64[ns]').view('i8')
+    step_ns = int(time_interval * 1_000_000_000)
+    texts = df['text'].to_numpy()
+    
+    # Newline counts for every entry in one pass (the very first entry gets none)
+    first_gap = max((int(ts_ns[0]) - prev_ns) // step_ns, 0) if prev_ns is not None else 0
+    gaps = gap_counts(ts_ns, step_ns, first_gap)
+    
+    # Collect every piece and join once, so the caller issues a single write
+    out = []
+    for newlines, text in zip(gaps.tolist(), texts):
+        out.append(_NL_CACHE[newlines] if newlines < _NL_CACHE_SIZE else '\n' * newlines)
+        out.append(text)
+    return ''.join(out), int(ts_ns[-1])
+
+class EntryReadError(Exception):
+    """Raised when the CSV can't be read while its entries are being streamed."""
+
+def read_entry_chunks(csv_path, chunksize):
+    """
+    Read a CSV's 'timestamp' and 'text' columns in chunks.
+    
+    Uses pyarrow's streaming CSV reader when it is installed (it reads fixed-size
+    blocks rather than chunksize rows), and pandas' chunked reader otherwise.
+    pyarrow rejects rows with fewer fields than the header, which Z writes for
+    entries without task flags; on such a file the rest is read with pandas.
+    
+    Parameters:
+    - csv_path: Path to the CSV file
+    - chunksize: Number of rows per chunk for the pandas reader
+    
+    Returns:
+    - iterator: DataFrame chunks with 'timestamp' and 'text' string columns
+    
+    Raises:
+    - EntryReadError: If the CSV can't be opened or parsed
+    """
+    try:
+        rows_read = 0
+        
+        if pacsv is not None:
+            try:
+                batches = pacsv.open_csv(
+                    csv_path,
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=['timestamp', 'text'],
+                        column_types={'timestamp': pa.string(), 'text': pa.string()},
+                        strings_can_be_null=True
+                    )
+                )
+                for batch in batches:
+                    chunk = batch.to_pandas()
+                    rows_read += len(chunk)
+                    yield chunk
+                return
+            except pa.ArrowInvalid:
+                pass
+        
+        chunks = pd.read_csv(
+            csv_path,
+            usecols=['timestamp', 'text'],
+            dtype={'timestamp': 'string', 'text': 'string'},
+            chunksize=chunksize
+        )
+        for chunk in chunks:
+            # Skip the rows pyarrow already delivered before it gave up
+            if rows_read:
+                skip = min(rows_read, len(chunk))
+                rows_read -= skip
+                chunk = chunk.iloc[skip:]
+                if chunk.empty:
+                    continue
+            yield chunk
+    except Exception as e:
+        raise EntryReadError(e) from e
+
+def write_entries(f, reader, time_interval):
+    """
+    Stream CSV chunks into an open output file as the temp file's text.
+    
+    Parameters:
+    - f: Output file opened for writing in binary mode
+    - reader: Iterable of DataFrame chunks from read_entry_chunks
+    - time_interval: Time interval in seconds for adding newlines between entries
+    
+    Returns:
+    - int: Number of entries written
+    """
+    prev_ns = None
+    count = 0
+    
+    for chunk in reader:
+        chunk = prepare_entries(chunk)
+        if chunk.empty:
+            continue
+        
+        text, prev_ns = render_entries(chunk, time_interval, prev_ns)
+        # Encode the whole chunk in one call rather than through a text-mode wrapper
+        data = text.encode('utf-8')
+        if _LINESEP != b'\n':
+            data = data.replace(b'\n', _LINESEP)
+        f.write(data)
+        count += len(chunk)
+    
+    return count
+
+def generate_temp_file(csv_filename=None, output_filename=None, time_interval=None, backup=False, chunksize=100_000):
     """
     Generate a temporary text file from CSV data, adding newlines based on the time difference
     between timestamps.
@@ -73,6 +351,8 @@ def generate_temp_file(csv_filename=None, output_filename=None, time_interval=No
     - csv_filename: Name of the CSV file containing timestamp and text data
     - output_filename: Name of the output text file
     - time_interval: Time interval in seconds for adding newlines between entries
+    - backup: Whether to copy the CSV to the temp directory first
+    - chunksize: Number of CSV rows parsed and written at a time
     
     Returns:
     - bool: True if successful, False otherwise
@@ -103,175 +383,90 @@ def generate_temp_file(csv_filename=None, output_filename=None, time_interval=No
         print(error_msg)
         
         # Create a popup if run from GUI
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("File Not Found", error_msg)
-            root.destroy()
-        except:
-            pass
-        
-        return
-    
-    # Read CSV file using pandas
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception as e:
-        error_msg = f"Error reading CSV file: {e}"
-        print(error_msg)
-        
-        # Create a popup if run from GUI
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Read Error", error_msg)
-            root.destroy()
-        except:
-            pass
+        show_popup("showerror", "File Not Found", error_msg)
         
         return
     
     # Create temp directory for potential backups
     temp_dir = file_helper.setup_temp_directory()
     
-    # Create backup of original file
-    try:
-        import shutil
+    # Create backup of original file on a worker thread so the copy overlaps the parse
+    if backup:
         backup_filename = os.path.join(temp_dir, f"backup_{os.path.basename(csv_path)}_{file_helper.generate_temp_filename()}")
-        shutil.copy2(csv_path, backup_filename)
-        print(f"Created backup at: {backup_filename}")
-    except Exception as e:
-        print(f"Warning: Could not create backup: {e}")
-    
-    # Filter out rows with empty text
-    df = df[df['text'].notna() & (df['text'] != '')]
-    
-    if df.empty:
-        print("No text entries found in the CSV file.")
-        try:
-            with open(output_path, 'w') as f:
-                pass  # Create empty file
-            print(f"Created empty output file: {output_filename}")
-        except Exception as e:
-            print(f"Error creating output file: {e}")
-        return
-    
-    # Parse timestamps
-    def parse_timestamp(ts_str):
-        try:
-            # Format: "2025-02-24 MON 14:30:45.123"
-            # Remove weekday abbreviation
-            parts = ts_str.split()
-            date_part = parts[0]
-            time_part = parts[2]
-            # Parse as datetime
-            return datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M:%S.%f")
-        except Exception:
-            # Return None if parsing fails
-            return None
-    
-    df['datetime'] = df['timestamp'].apply(parse_timestamp)
-    
-    # Remove rows with invalid timestamps
-    df = df[df['datetime'].notna()]
-    
-    if df.empty:
-        print("No valid timestamps found in the CSV file.")
-        try:
-            with open(output_path, 'w') as f:
-                pass  # Create empty file
-            print(f"Created empty output file: {output_filename}")
-        except Exception as e:
-            print(f"Error creating output file: {e}")
-        return
+        
+        def report_backup(future):
+            if future.exception() is None:
+                print(f"Created backup at: {backup_filename}")
+            else:
+                print(f"Warning: Could not create backup: {future.exception()}")
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(shutil.copy2, csv_path, backup_filename).add_done_callback(report_backup)
+        executor.shutdown(wait=False)
     
     # Process the entries and create the temp file
     # "for a configurable length of time (10 seconds by default), for however many whole multiples of ten 
     # two timestamps are separated, include one enter between the two pieces of text in the outputted text document"
+    # The CSV is read in chunks so memory stays bounded on large files, and the output is
+    # streamed to a temp file that only replaces output_path once the whole CSV was read
+    tmp_output_path = output_path + ".tmp"
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            prev_time = None
-            
-            for i, row in df.iterrows():
-                text = row['text']
-                curr_time = row['datetime']
-                
-                # Skip entries with invalid timestamps (should be filtered out already)
-                if curr_time is None:
-                    continue
-                
-                # Add newlines based on time difference
-                if prev_time is not None:
-                    time_diff = (curr_time - prev_time).total_seconds()
-                    newlines = int(time_diff // time_interval)
-                    f.write('\n' * newlines)
-                
-                # Write the text
-                f.write(text)
-                prev_time = curr_time
+        try:
+            with open(tmp_output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                count = write_entries(f, read_entry_chunks(csv_path, chunksize), time_interval)
+            os.replace(tmp_output_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_output_path):
+                os.remove(tmp_output_path)
+            raise
+        
+        if count == 0:
+            print("No valid entries found in the CSV file.")
+            print(f"Created empty output file: {output_filename}")
+            return
         
         print(f"Successfully created '{output_filename}'")
         
         # Show success message if run from GUI
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showinfo("Success", f"Successfully created '{output_filename}'")
-            root.destroy()
-        except:
-            pass
+        show_popup("showinfo", "Success", f"Successfully created '{output_filename}'")
+    
+    except EntryReadError as e:
+        error_msg = f"Error reading CSV file: {e}"
+        print(error_msg)
+        
+        # Create a popup if run from GUI
+        show_popup("showerror", "Read Error", error_msg)
             
     except Exception as e:
         error_msg = f"Error writing output file: {e}"
         print(error_msg)
         
         # Try writing to a temporary file instead if the main file fails
+        temp_output_path = os.path.join(temp_dir, f"temp_output_{file_helper.generate_temp_filename()}.txt")
         try:
-            temp_output_path = os.path.join(temp_dir, f"temp_output_{file_helper.generate_temp_filename()}.txt")
-            
-            with open(temp_output_path, 'w', encoding='utf-8') as f:
-                prev_time = None
-                
-                for i, row in df.iterrows():
-                    text = row['text']
-                    curr_time = row['datetime']
-                    
-                    if curr_time is None:
-                        continue
-                    
-                    if prev_time is not None:
-                        time_diff = (curr_time - prev_time).total_seconds()
-                        newlines = int(time_diff // time_interval)
-                        f.write('\n' * newlines)
-                    
-                    f.write(text)
-                    prev_time = curr_time
+            # Start over with a fresh reader - the first one may be partly consumed
+            with open(temp_output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                write_entries(f, read_entry_chunks(csv_path, chunksize), time_interval)
             
             print(f"Saved output to temporary file: {temp_output_path}")
             
             # Show warning message if run from GUI
-            try:
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showwarning(
-                    "File Access Warning",
-                    f"Could not write to '{output_filename}'. Output saved to: {temp_output_path}"
-                )
-                root.destroy()
-            except:
-                pass
+            show_popup(
+                "showwarning",
+                "File Access Warning",
+                f"Could not write to '{output_filename}'. Output saved to: {temp_output_path}"
+            )
                 
         except Exception as e2:
+            # Don't leave a partial file behind in the temp directory
+            if os.path.exists(temp_output_path):
+                os.remove(temp_output_path)
+            
             print(f"Critical error: Could not write to any output file: {e2}")
             
             # Show error message if run from GUI
-            try:
-                root = tk.Tk()
-                root.withdraw()
-                messagebox.showerror(
-                    "Critical Error",
-                    f"Failed to create output file in any location: {e2}"
-                )
-                root.destroy()
-            except:
-                pass
\ No newline at end of file
+            show_popup(
+                "showerror",
+                "Critical Error",
+                f"Failed to create output file in any location: {e2}"
+            )
\ No newline at end of file
@@ -5,7 +5,16 @@ Provides task management functionality for marking
 and extracting tasks from Z.csv.
 """
 
-from .task_manager import TaskManager
-from .task_list import TaskListDisplay
+__all__ = ['TaskManager', 'TaskListDisplay']
 
-__all__ = ['TaskManager', 'TaskListDisplay']
\ No newline at end of file
+
+def __getattr__(name):
+    # The GUI components are imported on first use, so running
+    # `python -m tasks.extract_tasks` from the command line doesn't load tkinter
+    if name == 'TaskManager':
+        from .task_manager import TaskManager
+        return TaskManager
+    if name == 'TaskListDisplay':
+        from .task_list import TaskListDisplay
+        return TaskListDisplay
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,24 @@ This script extracts rows from Z.csv based on task and completion status.
 import os
 import sys
 import pandas as pd
-import tkinter as tk
-from tkinter import messagebox, filedialog, ttk
+
+# Z directory, where the input and output files live
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, BASE_DIR)
+
+import file_helper
+
+# pyarrow is optional - its CSV reader and writer run in C on multiple threads
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Use pyarrow's multi-threaded CSV parser when it is installed
+CSV_ENGINE = 'pyarrow' if pacsv is not None else 'c'
 
 # Import configuration from config module if available
 try:
@@ -20,6 +33,78 @@ except ImportError:
     # Default if config module is missing
     DATA_CSV = "Z.csv"
 
+def read_source_csv(input_path):
+    """
+    Read the source CSV file.
+    
+    Uses pyarrow's parser when it is installed and the schema sentinel shows the
+    file was rewritten to full width - it rejects rows with fewer fields than the
+    header, which older versions of Z wrote. Other files are read with pandas' C
+    parser, which pads such rows, rather than parsed twice.
+    
+    Args:
+        input_path (str): Source CSV file
+        
+    Returns:
+        DataFrame: Contents of the CSV file
+    """
+    if CSV_ENGINE == 'pyarrow' and file_helper.schema_matches(input_path):
+        try:
+            return pd.read_csv(input_path, engine='pyarrow')
+        except (pa.ArrowInvalid, pd.errors.ParserError):
+            # Rows written by other tools; pandas re-raises pyarrow's parse errors as ParserError
+            pass
+    
+    return pd.read_csv(input_path, engine='c')
+
+def _load_tasks(input_filename):
+    """
+    Read the task rows of a source CSV in the Z directory.
+    
+    Args:
+        input_filename (str): Source CSV file, relative to the Z directory
+        
+    Returns:
+        DataFrame: Rows with task=1, or None if the file can't be used
+        str: Error message, or None on success
+    """
+    input_path = os.path.join(BASE_DIR, input_filename)
+    
+    # Check if input file exists
+    if not os.path.exists(input_path):
+        return None, f"Error: File '{input_filename}' not found"
+    
+    # Check if required columns exist, reading only the header line
+    if 'task' not in pd.read_csv(input_path, nrows=0).columns:
+        return None, f"Error: No 'task' column found in '{input_filename}'"
+    
+    # Read the CSV file
+    df = read_source_csv(input_path)
+    
+    # Filter rows where task is explicitly 1
+    # Compared numerically so 1, 1.0 and '1' all match; null/invalid values become NaN
+    return df[pd.to_numeric(df['task'], errors='coerce').eq(1)], None
+
+def write_tasks_csv(df, output_path):
+    """
+    Write extracted tasks to a CSV file.
+    
+    Uses pyarrow's CSV writer when it is installed, and pandas otherwise.
+    
+    Args:
+        df (DataFrame): Tasks to write
+        output_path (str): Destination CSV file
+    """
+    if pacsv is not None:
+        try:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_path)
+            return
+        except pa.ArrowException:
+            # Columns pyarrow can't convert (e.g. mixed types) - let pandas write them
+            pass
+    
+    df.to_csv(output_path, index=False)
+
 def extract_tasks(input_filename=None, output_filename=None, filter_completed=False, only_completed=False):
     """
     Extract tasks from Z.csv to a separate file.
@@ -34,13 +119,14 @@ def extract_tasks(input_filename=None, output_filename=None, filter_completed=Fa
         str: Success/error message
     """
     try:
-        # Get the directory where the script is located
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
         # Default input filename
         if input_filename is None:
             input_filename = DATA_CSV
         
+        tasks_df, error = _load_tasks(input_filename)
+        if error:
+            return error
+        
         # Default output filename
         if output_filename is None:
             if only_completed and filter_completed:
@@ -50,34 +136,18 @@ def extract_tasks(input_filename=None, output_filename=None, filter_completed=Fa
             else:
                 output_filename = "tasks.csv"
         
-        # Full paths
-        input_path = os.path.join(script_dir, input_filename)
-        output_path = os.path.join(script_dir, output_filename)
-        
-        # Check if input file exists
-        if not os.path.exists(input_path):
-            return f"Error: File '{input_filename}' not found"
-        
-        # Read the CSV file
-        df = pd.read_csv(input_path)
-        
-        # Check if required columns exist
-        if 'task' not in df.columns:
-            return f"Error: No 'task' column found in '{input_filename}'"
-        
-        # Filter rows where task is explicitly 1
-        # This will handle various data types and exclude null/empty values
-        tasks_df = df[df['task'].notna() & (df['task'].astype(str) == '1')]
+        output_path = os.path.join(BASE_DIR, output_filename)
         
         # Apply completed filter if requested
-        if filter_completed and 'completed' in df.columns:
+        if filter_completed and 'completed' in tasks_df.columns:
+            is_completed = pd.to_numeric(tasks_df['completed'], errors='coerce').eq(1)
             if only_completed:
                 # Get only completed tasks
-                tasks_df = tasks_df[tasks_df['completed'].notna() & (tasks_df['completed'].astype(str) == '1')]
+                tasks_df = tasks_df[is_completed]
                 filter_description = "completed "
             else:
                 # Get only non-completed tasks
-                tasks_df = tasks_df[~(tasks_df['completed'].notna() & (tasks_df['completed'].astype(str) == '1'))]
+                tasks_df = tasks_df[~is_completed]
                 filter_description = "pending "
         else:
             filter_description = ""
@@ -87,18 +157,67 @@ def extract_tasks(input_filename=None, output_filename=None, filter_completed=Fa
             return f"No {filter_description}tasks found in '{input_filename}'"
         
         # Save to output file
-        tasks_df.to_csv(output_path, index=False)
+        write_tasks_csv(tasks_df, output_path)
         
         return f"Successfully extracted {len(tasks_df)} {filter_description}tasks to '{output_filename}'"
         
     except Exception as e:
         return f"Error extracting tasks: {str(e)}"
 
+def extract_tasks_batch(input_filename=None, completed_filename="completed_tasks.csv", pending_filename="pending_tasks.csv"):
+    """
+    Extract completed and pending tasks to two files, reading the source CSV once.
+    
+    Args:
+        input_filename (str, optional): Source CSV file
+        completed_filename (str): Destination CSV file for completed tasks
+        pending_filename (str): Destination CSV file for pending tasks
+        
+    Returns:
+        str: Success/error message
+    """
+    try:
+        # Default input filename
+        if input_filename is None:
+            input_filename = DATA_CSV
+        
+        tasks_df, error = _load_tasks(input_filename)
+        if error:
+            return error
+        
+        # Split the tasks by completion status; without a 'completed' column every task is pending
+        if 'completed' in tasks_df.columns:
+            is_completed = pd.to_numeric(tasks_df['completed'], errors='coerce').eq(1)
+        else:
+            is_completed = pd.Series(False, index=tasks_df.index)
+        
+        # Save both output files
+        results = []
+        for filter_description, filename, mask in (
+            ("completed", completed_filename, is_completed),
+            ("pending", pending_filename, ~is_completed)
+        ):
+            subset = tasks_df[mask]
+            if subset.empty:
+                results.append(f"No {filter_description} tasks found in '{input_filename}'")
+            else:
+                write_tasks_csv(subset, os.path.join(BASE_DIR, filename))
+                results.append(f"Successfully extracted {len(subset)} {filter_description} tasks to '{filename}'")
+        
+        return "\n".join(results)
+        
+    except Exception as e:
+        return f"Error extracting tasks: {str(e)}"
+
 class TaskExtractorApp:
     """GUI application for extracting tasks from Z.csv"""
     
     def __init__(self, root):
         """Initialize the task extractor app"""
+        # tkinter is only imported by the GUI, so command-line runs don't load it
+        import tkinter as tk
+        from tkinter import ttk
+        
         self.root = root
         root.title("Z Task Extractor")
         root.geometry("450x300")
@@ -190,6 +309,8 @@ class TaskExtractorApp:
     
     def toggle_completion_options(self):
         """Enable/disable completion filter options"""
+        import tkinter as tk
+        
         if self.filter_completed_var.get():
             state = tk.NORMAL
         else:
@@ -200,6 +321,8 @@ class TaskExtractorApp:
     
     def browse_input(self):
         """Open file dialog to select input CSV file"""
+        from tkinter import filedialog
+        
         filename = filedialog.askopenfilename(
             initialdir=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             title="Select input CSV file",
@@ -210,6 +333,8 @@ class TaskExtractorApp:
     
     def browse_output(self):
         """Open file dialog to select output CSV file"""
+        from tkinter import filedialog
+        
         filename = filedialog.asksaveasfilename(
             initialdir=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             title="Select output CSV file",
@@ -221,6 +346,8 @@ class TaskExtractorApp:
     
     def extract(self):
             """Extract tasks from input file to output file"""
+            from tkinter import messagebox
+            
             # Get filter options
             filter_completed = self.filter_completed_var.get()
             only_completed = self.completion_option_var.get() == "completed" if filter_completed else False
@@ -260,6 +387,13 @@ def main():
             print("Options:")
             print("  --pending: Extract only pending tasks")
             print("  --completed: Extract only completed tasks")
+            print("  --both: Extract completed and pending tasks to completed_tasks.csv and pending_tasks.csv")
+            return
+        
+        # Write both completion variants from a single read
+        if "--both" in sys.argv[1:]:
+            files = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+            print(extract_tasks_batch(files[0] if files else None))
             return
         
         # Get input and output filenames
@@ -283,6 +417,7 @@ def main():
         print(result)
     else:
         # GUI mode
+        import tkinter as tk
         root = tk.Tk()
         app = TaskExtractorApp(root)
         root.mainloop()
@@ -6,9 +6,341 @@ Uses integer values (0 or 1) for task flags for efficiency.
 """
 
 import os
+import io
+import csv
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import ttk, messagebox
+import file_helper
+
+# Auto-refresh polling: the base interval, the ceiling it backs off to while the
+# CSV is unchanged, and the short delay used right after a local change (ms)
+AUTO_REFRESH_MS = 5000
+AUTO_REFRESH_MAX_MS = 30000
+REFRESH_SOON_MS = 250
+
+# How often the Tk thread checks whether a background refresh has finished (ms)
+REFRESH_POLL_MS = 50
+
+# Buffer size for reading and rewriting the CSV (1 MiB)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Columns the task list uses; any others in the CSV are not parsed
+TASK_COLUMNS = ('timestamp', 'text', 'task', 'completed')
+
+# pyarrow is optional - its CSV reader parses on multiple threads and applies column types directly
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as pafeather
+except ImportError:
+    pacsv = None
+    pafeather = None
+
+# CSVs larger than this are streamed through pyarrow in blocks of STREAM_BLOCK_SIZE,
+# keeping only the open task rows instead of materializing the whole file
+STREAM_THRESHOLD = 64 << 20
+STREAM_BLOCK_SIZE = 8 << 20
+
+# Rows per chunk when a large CSV has to be streamed through pandas instead
+STREAM_CHUNK_ROWS = 1 << 18
+
+# Columnar snapshot of the parsed task columns, kept next to the CSV so a restart
+# doesn't have to parse an unchanged CSV again (needs pyarrow)
+SNAPSHOT_SUFFIX = ".tasks.feather"
+
+# watchdog is optional - with it the CSV is watched for changes instead of polled
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# Number of logged completions after which they are folded into the CSV
+COMPLETIONS_COMPACT_THRESHOLD = 50
+
+# Idle time after the last completion before the log is folded into the CSV (ms),
+# so other readers of the CSV see completions without waiting for the threshold
+COMPLETIONS_IDLE_MS = 2000
+
+# Temporary file the compacted CSV is written to before it replaces the CSV
+COMPACT_SUFFIX = ".compacting"
+
+def read_tasks_csv(csv_filename):
+    """
+    Read the task columns of the CSV file, with numeric task and completed flags.
+    
+    Only the columns in TASK_COLUMNS are parsed. The flags are read as floats,
+    so 1, 1.0 and empty values all parse; anything else becomes NaN.
+    
+    pyarrow's parser rejects rows with fewer fields than the header, so it is only
+    used once the schema sentinel shows the file was rewritten to full width; older
+    files are left to pandas, which pads short rows, rather than parsed twice.
+    
+    Args:
+        csv_filename (str): Path to the CSV file
+        
+    Returns:
+        DataFrame: Contents of the CSV file
+    """
+    # pyarrow rejects missing columns in include_columns, so check the header first
+    with open(csv_filename, 'r', newline='') as f:
+        header = next(csv.reader(f), [])
+    
+    # Large files are filtered as they are read rather than materialized whole
+    stream = 'task' in header and 'completed' in header and os.path.getsize(csv_filename) > STREAM_THRESHOLD
+    
+    if pacsv is not None and file_helper.schema_matches(csv_filename):
+        try:
+            convert_options = pacsv.ConvertOptions(
+                include_columns=[c for c in header if c in TASK_COLUMNS],
+                column_types={
+                    'timestamp': pa.string(),
+                    'text': pa.string(),
+                    'task': pa.float64(),
+                    'completed': pa.float64()
+                }
+            )
+            
+            if stream:
+                return stream_tasks_csv(csv_filename, convert_options)
+            
+            table = pacsv.read_csv(
+                csv_filename,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+                convert_options=convert_options
+            )
+            return table.to_pandas()
+        except pa.ArrowInvalid:
+            # Non-numeric flags or rows written by other tools - let pandas coerce them
+            pass
+    
+    if stream:
+        return chunk_tasks_csv(csv_filename)
+    
+    with open(csv_filename, 'rb', buffering=CSV_BUFFER_SIZE) as f:
+        df = pd.read_csv(f, usecols=lambda c: c in TASK_COLUMNS)
+    
+    # Convert values to numbers to handle mixed data types in CSV, coercing errors to NaN
+    for column in ('task', 'completed'):
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+    
+    return df
+
+def stream_tasks_csv(csv_filename, convert_options):
+    """
+    Stream a large CSV through pyarrow, keeping only the open task rows.
+    
+    Each block is parsed on pyarrow's worker threads and filtered as soon as it
+    arrives, so memory holds the selected rows rather than the whole file.
+    
+    Args:
+        csv_filename (str): Path to the CSV file
+        convert_options (ConvertOptions): Column selection and types
+        
+    Returns:
+        DataFrame: Rows with task=1 and completed not 1, indexed by row number
+    """
+    reader = pacsv.open_csv(
+        csv_filename,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=STREAM_BLOCK_SIZE),
+        convert_options=convert_options
+    )
+    
+    batches = []
+    rows = []
+    offset = 0
+    for batch in reader:
+        task = pc.fill_null(pc.equal(batch.column('task'), 1), False)
+        completed = pc.fill_null(pc.equal(batch.column('completed'), 1), False)
+        keep = pc.and_(task, pc.invert(completed))
+        
+        batches.append(batch.filter(keep))
+        rows.append(np.flatnonzero(keep.to_numpy(zero_copy_only=False)) + offset)
+        offset += batch.num_rows
+    
+    df = pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+    df.index = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    return df
+
+def chunk_tasks_csv(csv_filename):
+    """
+    Read a large CSV with pandas in chunks, keeping only the open task rows.
+    
+    This is the fallback for files stream_tasks_csv can't read, e.g. ones with
+    rows shorter than the header, which pandas pads. Memory still holds only the
+    selected rows and one chunk.
+    
+    Args:
+        csv_filename (str): Path to the CSV file
+        
+    Returns:
+        DataFrame: Rows with task=1 and completed not 1, indexed by row number
+    """
+    chunks = []
+    with open(csv_filename, 'rb', buffering=CSV_BUFFER_SIZE) as f:
+        for chunk in pd.read_csv(f, usecols=lambda c: c in TASK_COLUMNS, chunksize=STREAM_CHUNK_ROWS):
+            task = pd.to_numeric(chunk['task'], errors='coerce')
+            completed = pd.to_numeric(chunk['completed'], errors='coerce')
+            keep = task.eq(1) & completed.ne(1)
+            
+            chunk = chunk[keep]
+            chunk['task'] = task[keep]
+            chunk['completed'] = completed[keep]
+            chunks.append(chunk)
+    
+    return pd.concat(chunks)
+
+def _flag_fields(buf, starts, ends):
+    """
+    Classify CSV flag fields given as byte ranges of buf.
+    
+    Args:
+        buf (ndarray): uint8 view of the file
+        starts (ndarray): Start offset of every field
+        ends (ndarray): End offset (exclusive) of every field
+        
+    Returns:
+        ndarray: Boolean mask of the fields that read as 1
+        bool: True if every field is one of "", 0, 1, 0.0 or 1.0
+    """
+    lengths = ends - starts
+    last = len(buf) - 1
+    first = buf[np.minimum(starts, last)]
+    dot = buf[np.minimum(starts + 1, last)]
+    zero = buf[np.minimum(starts + 2, last)]
+    
+    digit = (first == ord('0')) | (first == ord('1'))
+    fraction = (dot == ord('.')) & (zero == ord('0'))
+    valid = (lengths == 0) | ((lengths == 1) & digit) | ((lengths == 3) & digit & fraction)
+    
+    return valid & (lengths > 0) & (first == ord('1')), bool(valid.all())
+
+def scan_tasks_csv(csv_filename):
+    """
+    Pick out the uncompleted task rows of the CSV without parsing the rest of it.
+    
+    The file is memory-mapped and its line and comma positions are found with
+    vectorized byte scans; only the rows that pass the task filter are decoded.
+    This only works for the plain layout Z writes itself - exactly the columns
+    timestamp,text,task,completed (rows may leave out the trailing flags), no
+    quoted fields, and flags written as 0/1 (or 0.0/1.0) - otherwise None is
+    returned and the full parser has to be used.
+    
+    Args:
+        csv_filename (str): Path to the CSV file
+        
+    Returns:
+        DataFrame: Task columns of the rows with task=1 and completed not 1,
+            indexed by row number as pandas would number them, or None
+    """
+    with open(csv_filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Quoted fields can hide commas and newlines - leave those files to the real parser
+            if mm.find(b'"') != -1:
+                return None
+            
+            header_end = mm.find(b'\n')
+            if header_end == -1 or mm[:header_end].rstrip(b'\r') != ','.join(TASK_COLUMNS).encode():
+                return None
+            
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                # Line boundaries; a last line without a newline ends at the end of the file
+                newlines = np.flatnonzero(buf == ord('\n'))
+                if newlines[-1] != len(buf) - 1:
+                    newlines = np.append(newlines, len(buf))
+                starts = newlines[:-1] + 1
+                ends = newlines[1:]
+                
+                # Drop a trailing \r, then skip blank lines as pandas does
+                cr = buf[np.maximum(ends - 1, 0)] == ord('\r')
+                ends = ends - (cr & (ends > starts))
+                nonblank = ends > starts
+                starts = starts[nonblank]
+                ends = ends[nonblank]
+                
+                # Every row must have two to four fields; Z leaves out trailing flags
+                # it doesn't set, which pandas reads as empty
+                commas = np.flatnonzero(buf == ord(','))
+                first_comma = np.searchsorted(commas, starts)
+                fields = np.searchsorted(commas, ends) - first_comma + 1
+                if not ((fields >= 2) & (fields <= 4)).all():
+                    return None
+                
+                # Positions of the commas separating the fields of each row; a missing
+                # field starts and ends at the end of its row, so it reads as empty
+                last = len(commas) - 1
+                c1 = commas[first_comma]
+                c2 = np.where(fields >= 3, commas[np.minimum(first_comma + 1, last)], ends)
+                c3 = np.where(fields == 4, commas[np.minimum(first_comma + 2, last)], ends)
+                task_start = np.minimum(c2 + 1, c3)
+                completed_start = np.minimum(c3 + 1, ends)
+                
+                is_task, task_ok = _flag_fields(buf, task_start, c3)
+                is_completed, completed_ok = _flag_fields(buf, completed_start, ends)
+                if not (task_ok and completed_ok):
+                    return None
+                
+                rows = np.flatnonzero(is_task & ~is_completed)
+                
+                # Decode just the rows that will be shown
+                timestamps = [mm[a:b].decode('utf-8') for a, b in zip(starts[rows].tolist(), c1[rows].tolist())]
+                texts = [mm[a:b].decode('utf-8') for a, b in zip((c1[rows] + 1).tolist(), c2[rows].tolist())]
+                completed = np.where(ends[rows] > completed_start[rows], 0.0, np.nan)
+            finally:
+                # The map can't be closed while NumPy still holds a view of it
+                del buf
+    
+    return pd.DataFrame(
+        {
+            'timestamp': timestamps,
+            'text': texts,
+            'task': np.ones(len(rows)),
+            'completed': completed
+        },
+        index=rows
+    )
+
+class CsvWatchHandler(FileSystemEventHandler):
+    """Passes changes to the CSV file on to the task list."""
+    
+    def __init__(self, display):
+        """
+        Initialize the handler.
+        
+        Args:
+            display (TaskListDisplay): Task list to refresh
+        """
+        super().__init__()
+        self.display = display
+        self.csv_path = os.path.normcase(os.path.abspath(display.app.data_manager.csv_filename))
+    
+    def on_any_event(self, event):
+        """Schedule a refresh on the Tk thread when the CSV is written, created or replaced."""
+        # Ignore opens and reads, including the task list's own
+        if event.event_type in ('opened', 'closed_no_write'):
+            return
+        
+        paths = (event.src_path, getattr(event, 'dest_path', None))
+        if not any(path and os.path.normcase(os.path.abspath(path)) == self.csv_path for path in paths):
+            return
+        
+        try:
+            # Events arrive on the observer thread; Tk calls have to run on the main thread
+            self.display.app.root.after(0, self.display.refresh_soon)
+        except Exception:
+            # The window is already closed
+            pass
 
 class TaskListDisplay:
     """Component for displaying uncompleted tasks."""
@@ -26,6 +358,30 @@ class TaskListDisplay:
         self.tasks_df = None
         self.task_indices = []
         
+        # Refreshes read the CSV on a worker thread so a large file doesn't block the UI
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1)
+        self._refresh_future = None
+        self._refresh_pending = False
+        
+        # (item id, values) pairs currently shown in the task tree
+        self._tree_rows = []
+        
+        # Parse of the CSV behind the list on screen as ((mtime_ns, size), DataFrame),
+        # reused while the file is unchanged
+        self._csv_cache = None
+        
+        # Task flag mask of that parse, as (DataFrame, mask)
+        self._flag_mask = None
+        
+        # Completions are appended to a small sidecar log instead of rewriting the CSV
+        self.completions_path = self.app.data_manager.csv_filename + ".completed"
+        self.pending_completions = 0
+        self._compact_job = None
+        self._compact_future = None
+        
+        # Fold completions logged by earlier sessions into the CSV
+        self.compact_completions()
+        
         # Create task list frame
         self.create_task_list()
         
@@ -84,79 +440,504 @@ class TaskListDisplay:
         self.frame.grid_rowconfigure(0, weight=1)
     
     def setup_auto_refresh(self):
-        """Set up periodic refresh of the task list."""
-        # Refresh every 5 seconds
-        self.app.root.after(5000, self.auto_refresh)
+        """Set up automatic refresh of the task list."""
+        self._refresh_delay = AUTO_REFRESH_MS
+        self._refresh_job = None
+        
+        # Watch the CSV if possible; otherwise poll it, starting at the base interval
+        self._observer = self.start_watching()
+        if self._observer is None:
+            self._refresh_job = self.app.root.after(self._refresh_delay, self.auto_refresh)
+    
+    def start_watching(self):
+        """
+        Start watching the CSV file's directory for changes.
+        
+        Returns:
+            Observer: The running observer, or None if watchdog is unavailable
+        """
+        if Observer is None:
+            return None
+        
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(
+                CsvWatchHandler(self),
+                os.path.dirname(os.path.abspath(self.app.data_manager.csv_filename)),
+                recursive=False
+            )
+            observer.start()
+            return observer
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error watching CSV file, polling instead: {e}")
+            return None
     
     def auto_refresh(self):
-        """Automatically refresh the task list periodically."""
-        self.refresh_tasks()
-        # Schedule next refresh
-        self.app.root.after(5000, self.auto_refresh)
+        """Refresh the task list if the CSV has changed."""
+        self._refresh_job = None
+        
+        if self.csv_changed():
+            self.refresh_tasks()
+            self._refresh_delay = AUTO_REFRESH_MS
+        else:
+            # Poll less often while the file sits unchanged
+            self._refresh_delay = min(self._refresh_delay * 2, AUTO_REFRESH_MAX_MS)
+        
+        # Schedule next refresh - not needed when the watcher reports changes
+        if self._observer is None:
+            self._refresh_job = self.app.root.after(self._refresh_delay, self.auto_refresh)
+    
+    def restart_polling(self):
+        """Schedule the next poll at the base interval, dropping any backoff."""
+        if self._observer is not None:
+            return
+        
+        if self._refresh_job is not None:
+            self.app.root.after_cancel(self._refresh_job)
+        self._refresh_delay = AUTO_REFRESH_MS
+        self._refresh_job = self.app.root.after(self._refresh_delay, self.auto_refresh)
+    
+    def refresh_soon(self):
+        """Refresh shortly after a change and go back to polling at the base interval."""
+        # Collapses a burst of changes into a single refresh
+        if self._refresh_job is not None:
+            self.app.root.after_cancel(self._refresh_job)
+        self._refresh_delay = AUTO_REFRESH_MS
+        self._refresh_job = self.app.root.after(REFRESH_SOON_MS, self.auto_refresh)
+    
+    def csv_changed(self):
+        """
+        Check whether the CSV file has changed since it was last read.
+        
+        Returns:
+            bool: True if the file changed, or its state is unknown
+        """
+        try:
+            st = os.stat(self.app.data_manager.csv_filename)
+        except OSError:
+            return True
+        
+        return self._csv_cache is None or self._csv_cache[0] != (st.st_mtime_ns, st.st_size)
+    
+    def read_csv_cached(self):
+        """
+        Read the CSV file, skipping the parse if it hasn't changed since the last read.
+        
+        The parse is only cached once show_tasks has displayed it, so the cache
+        always describes the list on screen.
+        
+        Returns:
+            tuple: (key, df) - the CSV file's (mtime_ns, size) and its task columns,
+                only the rows that can be shown if the fast scan was used
+        """
+        csv_filename = self.app.data_manager.csv_filename
+        st = os.stat(csv_filename)
+        key = (st.st_mtime_ns, st.st_size)
+        
+        cache = self._csv_cache
+        if cache is not None and cache[0] == key:
+            return cache
+        
+        df = self.read_snapshot(key)
+        if df is None:
+            # Without pyarrow, scan a plain CSV for the candidate rows instead of
+            # running the slower pandas parser; its threaded reader wins otherwise
+            df = None
+            if pacsv is None:
+                try:
+                    df = scan_tasks_csv(csv_filename)
+                except (ValueError, UnicodeDecodeError):
+                    df = None
+            if df is None:
+                df = read_tasks_csv(csv_filename)
+            self.write_snapshot(df, key)
+        
+        return key, df
+    
+    def read_snapshot(self, key):
+        """
+        Load the columnar snapshot of the CSV, if it was taken of the file as it is now.
+        
+        Args:
+            key (tuple): (mtime_ns, size) of the CSV file
+            
+        Returns:
+            DataFrame: Snapshot contents, or None if there is no up-to-date snapshot
+        """
+        snapshot_path = self.app.data_manager.csv_filename + SNAPSHOT_SUFFIX
+        if pafeather is None or not os.path.exists(snapshot_path):
+            return None
+        
+        try:
+            table = pafeather.read_table(snapshot_path, memory_map=True)
+            if (table.schema.metadata or {}).get(b'csv_key') != f"{key[0]},{key[1]}".encode():
+                return None
+            return table.to_pandas()
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error reading task snapshot: {e}")
+            return None
+    
+    def write_snapshot(self, df, key):
+        """
+        Save a columnar snapshot of the parsed CSV.
+        
+        Args:
+            df (DataFrame): Parsed task columns
+            key (tuple): (mtime_ns, size) of the CSV file they were read from
+        """
+        if pafeather is None:
+            return
+        
+        snapshot_path = self.app.data_manager.csv_filename + SNAPSHOT_SUFFIX
+        try:
+            table = pa.Table.from_pandas(df)
+            metadata = dict(table.schema.metadata or {})
+            metadata[b'csv_key'] = f"{key[0]},{key[1]}".encode()
+            
+            # Write to a temp file and swap it in so readers never see a partial snapshot
+            tmp_path = snapshot_path + ".tmp"
+            pafeather.write_feather(table.replace_schema_metadata(metadata), tmp_path)
+            os.replace(tmp_path, snapshot_path)
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error writing task snapshot: {e}")
+    
+    def load_tasks(self):
+        """
+        Read the CSV file and select the uncompleted tasks.
+        
+        Returns:
+            DataFrame: Uncompleted tasks, or None if there are none to show
+            tuple: (key, df) parse of the CSV from read_csv_cached, or None if there is no file
+        """
+        # Check if CSV file exists
+        if not os.path.exists(self.app.data_manager.csv_filename):
+            self.app.error_handler.log_info("CSV file not found during task refresh")
+            return None, None
+        
+        # Read the CSV file
+        cache = self.read_csv_cached()
+        df = cache[1]
+        
+        # Check if task and completed columns exist
+        if 'task' not in df.columns or 'completed' not in df.columns:
+            self.app.error_handler.log_info("Task or completed columns not found")
+            return None, cache
+        
+        # read_tasks_csv has already converted the flags to numbers
+        try:
+            # Filter for task=1 and (completed is not 1)
+            # This works with integers (1), floats (1.0), or strings ('1') in the CSV
+            # The flags only change with the CSV, so the mask is reused while its parse is cached
+            if self._flag_mask is None or self._flag_mask[0] is not df:
+                # Compared as plain float arrays: NaN != 1, so missing completed flags count as not completed
+                task = df['task'].to_numpy(dtype=np.float64, na_value=np.nan)
+                completed = df['completed'].to_numpy(dtype=np.float64, na_value=np.nan)
+                self._flag_mask = (df, (task == 1) & (completed != 1))
+            
+            # Leave out tasks completed since the CSV was last compacted
+            mask = self._flag_mask[1] & ~self.logged_completions(df)
+            
+            # Apply the mask
+            tasks_df = df[mask]
+            
+            # Log for debugging
+            self.app.error_handler.log_info(f"Found {len(tasks_df)} uncompleted tasks")
+            
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error filtering tasks: {e}")
+            return None, cache
+        
+        # Check if any tasks were found
+        if tasks_df.empty:
+            self.app.error_handler.log_info("No uncompleted tasks found")
+        
+        return tasks_df, cache
     
     def refresh_tasks(self):
-        """Load and display uncompleted tasks."""
+        """Load uncompleted tasks on the worker thread and display them when they are ready."""
+        # A refresh is already running - run one more once it finishes, in case the file changed since
+        if self._refresh_future is not None and not self._refresh_future.done():
+            self._refresh_pending = True
+            return
+        
+        self._refresh_future = self._refresh_executor.submit(self.load_task_rows)
+        self.app.root.after(REFRESH_POLL_MS, self.poll_refresh, self._refresh_future)
+    
+    def poll_refresh(self, future):
+        """
+        Display a background refresh once it has finished. Runs on the Tk thread.
+        
+        The worker thread makes no Tk calls itself - Tk only accepts them from the
+        main thread, and not at all before the main loop starts.
+        
+        Args:
+            future (Future): Running load_task_rows call
+        """
+        if not future.done():
+            self.app.root.after(REFRESH_POLL_MS, self.poll_refresh, future)
+            return
+        
+        self.show_tasks(future)
+    
+    def load_task_rows(self):
+        """
+        Load the uncompleted tasks and build their tree rows. Runs on the worker thread.
+        
+        Returns:
+            DataFrame: Uncompleted tasks, or None if there are none to show
+            list: (item id, values) pairs for update_tree
+            tuple: (key, df) parse of the CSV, for show_tasks to cache
+        """
+        tasks_df, cache = self.load_tasks()
+        if tasks_df is None:
+            return None, [], cache
+        
+        # Tree items are keyed by dataframe index; values are strings, as Tk would display them
+        rows = [
+            (str(idx), (str(text), str(timestamp)))
+            for idx, text, timestamp in zip(
+                tasks_df.index.tolist(),
+                tasks_df['text'].to_numpy(),
+                tasks_df['timestamp'].to_numpy()
+            )
+        ]
+        return tasks_df, rows, cache
+    
+    def show_tasks(self, future):
+        """
+        Display the result of a background refresh.
+        
+        Args:
+            future (Future): Finished load_task_rows call
+        """
         try:
-            # Clear the task tree
-            for item in self.task_tree.get_children():
-                self.task_tree.delete(item)
+            self.tasks_df, rows, cache = future.result()
             
-            # Reset stored data
-            self.task_indices = []
+            # Store the original dataframe indices
+            self.task_indices = self.tasks_df.index.tolist() if self.tasks_df is not None else []
             
-            # Check if CSV file exists
-            if not os.path.exists(self.app.data_manager.csv_filename):
-                self.app.error_handler.log_info("CSV file not found during task refresh")
-                return
+            self.update_tree(rows)
             
-            # Read the CSV file
-            df = pd.read_csv(self.app.data_manager.csv_filename)
+            # Only now that it is on screen does the parse count as the CSV's last read
+            if cache is not None:
+                self._csv_cache = cache
             
-            # Check if task and completed columns exist
-            if 'task' not in df.columns or 'completed' not in df.columns:
-                self.app.error_handler.log_info("Task or completed columns not found")
-                return
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error refreshing tasks: {e}")
+        
+        # Catch up on a refresh requested while this one was running
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_tasks()
+    
+    def update_tree(self, rows):
+        """
+        Bring the task tree in line with rows, touching only the items that changed.
+        
+        Args:
+            rows (list): (item id, values) pairs in display order
+        """
+        # Nothing changed since the last update - leave the widget alone
+        if rows == self._tree_rows:
+            return
+        
+        tree = self.task_tree
+        new_ids = [iid for iid, _ in rows]
+        keep = set(new_ids)
+        
+        # Remove tasks that are gone
+        existing = tree.get_children()
+        stale = [iid for iid in existing if iid not in keep]
+        if stale:
+            tree.delete(*stale)
+        existing = [iid for iid in existing if iid in keep]
+        present = set(existing)
+        
+        # If the remaining tasks were reordered, rebuild the tree rather than moving items one by one
+        if existing != [iid for iid in new_ids if iid in present]:
+            tree.delete(*existing)
+            present = set()
+        
+        # Insert new tasks in place and update any whose text changed
+        # Inserts go straight to the Tcl command, skipping Treeview.insert's per-call option
+        # formatting - after a rebuild that is one call per task
+        old_values = dict(self._tree_rows)
+        tk_call = tree.tk.call
+        for position, (iid, values) in enumerate(rows):
+            if iid not in present:
+                tk_call(tree._w, "insert", "", position, "-id", iid, "-values", values)
+            elif old_values.get(iid) != values:
+                tree.item(iid, values=values)
+        
+        self._tree_rows = rows
+    
+    def read_completions(self, data=None):
+        """
+        Read the completions logged since the CSV was last compacted.
+        
+        Args:
+            data (bytes, optional): Contents of the log, if already read
             
-            # Convert values to integers to handle mixed data types in CSV
-            try:
-                # Convert task column to numeric, coercing errors to NaN
-                df['task'] = pd.to_numeric(df['task'], errors='coerce')
-                
-                # Convert completed column to numeric, coercing errors to NaN
-                df['completed'] = pd.to_numeric(df['completed'], errors='coerce')
-                
-                # Filter for task=1 and (completed is not 1)
-                # This works with integers (1), floats (1.0), or strings ('1') in the CSV
-                mask = (df['task'] == 1) & ((df['completed'] != 1) | df['completed'].isna())
-                
-                # Apply the mask
-                self.tasks_df = df[mask].copy()
-                
-                # Log for debugging
-                self.app.error_handler.log_info(f"Found {len(self.tasks_df)} uncompleted tasks")
-                
-            except Exception as e:
-                self.app.error_handler.log_error(f"Error filtering tasks: {e}")
+        Returns:
+            list: (row index, timestamp) pairs
+        """
+        if data is None:
+            if not os.path.exists(self.completions_path):
+                return []
+            with open(self.completions_path, 'rb') as f:
+                data = f.read()
+        
+        completions = []
+        for row in csv.reader(io.StringIO(data.decode('utf-8'), newline='')):
+            # Skip lines left incomplete by an interrupted write
+            if len(row) == 2 and row[0].isdigit():
+                completions.append((int(row[0]), row[1]))
+        return completions
+    
+    def logged_completions(self, df, data=None):
+        """
+        Find the rows of the CSV completed through the completions log.
+        
+        Args:
+            df (DataFrame): Contents of the CSV file
+            data (bytes, optional): Contents of the log, if already read
+            
+        Returns:
+            ndarray: Boolean mask of the completed rows
+        """
+        completions = self.read_completions(data)
+        self.pending_completions = len(completions)
+        
+        # Only trust an entry if the row still has the timestamp that was logged
+        done = [idx for idx, timestamp in completions
+                if idx in df.index and str(df.at[idx, 'timestamp']) == timestamp]
+        return df.index.isin(done)
+    
+    def schedule_compaction(self):
+        """Fold the completions log into the CSV once no completion has been logged for a while."""
+        if self._compact_job is not None:
+            self.app.root.after_cancel(self._compact_job)
+        self._compact_job = self.app.root.after(COMPLETIONS_IDLE_MS, self.compact_completions)
+    
+    def compact_completions(self, wait=False):
+        """
+        Write logged completions into the CSV and clear the log.
+        
+        The CSV is read and rewritten to a temporary file on the worker thread;
+        only swapping it in is left to the Tk thread, where Z's other writers run.
+        
+        Args:
+            wait (bool): Compact before returning, e.g. when the window closes
+        """
+        if self._compact_job is not None:
+            self.app.root.after_cancel(self._compact_job)
+            self._compact_job = None
+        
+        # A compaction is already running - it reschedules itself if more was logged meanwhile
+        if self._compact_future is not None:
+            if not wait:
+                return
+            self.finish_compaction(self._compact_future)
+        
+        if not os.path.exists(self.completions_path):
+            return
+        
+        self._compact_future = self._refresh_executor.submit(self.write_compacted)
+        if wait:
+            self.finish_compaction(self._compact_future)
+        else:
+            self.app.root.after(REFRESH_POLL_MS, self.poll_compaction, self._compact_future)
+    
+    def write_compacted(self):
+        """
+        Write the CSV with the logged completions applied to a temporary file. Runs on the worker thread.
+        
+        Returns:
+            tuple: ((mtime_ns, size) of the CSV that was read, log contents applied,
+                temporary file), or None if there is nothing to swap in
+        """
+        csv_filename = self.app.data_manager.csv_filename
+        if not os.path.exists(self.completions_path) or not os.path.exists(csv_filename):
+            return None
+        
+        with open(self.completions_path, 'rb') as f:
+            logged = f.read()
+        
+        st = os.stat(csv_filename)
+        with open(csv_filename, 'rb', buffering=CSV_BUFFER_SIZE) as f:
+            df = pd.read_csv(f)
+        
+        # Keep the log until there is a column to write it into
+        if 'completed' not in df.columns:
+            return None
+        
+        # Update the completed status - use integer 1 (most efficient)
+        df.loc[self.logged_completions(df, logged), 'completed'] = 1
+        
+        tmp_path = csv_filename + COMPACT_SUFFIX
+        with open(tmp_path, 'w', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as f:
+            df.to_csv(f, index=False)
+        
+        return (st.st_mtime_ns, st.st_size), logged, tmp_path
+    
+    def poll_compaction(self, future):
+        """
+        Finish a background compaction once it is done. Runs on the Tk thread.
+        
+        Args:
+            future (Future): Running write_compacted call
+        """
+        # Already finished by a compaction that had to wait for it
+        if future is not self._compact_future:
+            return
+        
+        if not future.done():
+            self.app.root.after(REFRESH_POLL_MS, self.poll_compaction, future)
+            return
+        
+        self.finish_compaction(future)
+    
+    def finish_compaction(self, future):
+        """
+        Swap the compacted CSV in and drop the completions it contains from the log.
+        
+        Args:
+            future (Future): write_compacted call, waited for if still running
+        """
+        self._compact_future = None
+        try:
+            result = future.result()
+            if result is None:
                 return
             
-            # Check if any tasks were found
-            if self.tasks_df.empty:
-                self.app.error_handler.log_info("No uncompleted tasks found")
+            key, logged, tmp_path = result
+            csv_filename = self.app.data_manager.csv_filename
+            
+            # An entry was written while the copy was made - replacing the CSV would lose it
+            st = os.stat(csv_filename)
+            if (st.st_mtime_ns, st.st_size) != key:
+                os.remove(tmp_path)
+                self.schedule_compaction()
                 return
             
-            # Add tasks to the treeview
-            for idx, row in self.tasks_df.iterrows():
-                text = row['text']
-                timestamp = row['timestamp']
-                
-                # Insert into treeview
-                self.task_tree.insert("", "end", values=(text, timestamp))
-                
-                # Store the original dataframe index
-                self.task_indices.append(idx)
+            os.replace(tmp_path, csv_filename)
+            self._csv_cache = None
+            
+            # The log is only appended to, so anything past what was applied was logged meanwhile
+            with open(self.completions_path, 'rb') as f:
+                rest = f.read()[len(logged):]
+            if rest:
+                with open(self.completions_path, 'wb') as f:
+                    f.write(rest)
+                self.schedule_compaction()
+            else:
+                os.remove(self.completions_path)
+            
+            self.pending_completions = len(self.read_completions(rest))
             
         except Exception as e:
-            self.app.error_handler.log_error(f"Error refreshing tasks: {e}")
+            self.app.error_handler.log_error(f"Error compacting completed tasks: {e}")
     
     def mark_selected_completed(self):
         """Mark the selected task as completed."""
@@ -167,23 +948,22 @@ class TaskListDisplay:
             return
         
         try:
-            # Get the index of the selected item in our list
-            selected_idx = self.task_tree.index(selected_item[0])
-            
-            # Get the original dataframe index
-            df_idx = self.task_indices[selected_idx]
-            
-            # Read the CSV file
-            df = pd.read_csv(self.app.data_manager.csv_filename)
+            # Tree items are keyed by the original dataframe index
+            df_idx = int(selected_item[0])
             
             # Store task text for feedback
-            task_text = df.at[df_idx, 'text']
+            task_text = self.tasks_df.at[df_idx, 'text']
             
-            # Update the completed status - use integer 1 (most efficient)
-            df.at[df_idx, 'completed'] = 1
+            # Log the completion - the row's timestamp guards against the CSV being reordered
+            with open(self.completions_path, 'a', newline='') as f:
+                csv.writer(f).writerow([df_idx, self.tasks_df.at[df_idx, 'timestamp']])
+            self.pending_completions += 1
             
-            # Write back to CSV
-            df.to_csv(self.app.data_manager.csv_filename, index=False)
+            # Fold the log into the CSV once it has grown, or once completions stop coming in
+            if self.pending_completions >= COMPLETIONS_COMPACT_THRESHOLD:
+                self.compact_completions()
+            else:
+                self.schedule_compaction()
             
             # Remove from treeview
             self.task_tree.delete(selected_item[0])
@@ -192,8 +972,9 @@ class TaskListDisplay:
             self.app.error_handler.log_info(f"Marked task as completed: {task_text}")
             self.app.gui_manager.set_feedback(f"Marked task as completed: {task_text}")
             
-            # Update task list
+            # Update task list and go back to polling at the base interval
             self.refresh_tasks()
+            self.restart_polling()
             
         except Exception as e:
             self.app.error_handler.log_error(f"Error marking task as completed: {e}")
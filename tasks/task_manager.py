@@ -6,10 +6,18 @@ Tasks are marked by integer flags in the CSV data (0 or 1).
 """
 
 import os
+import re
 import csv
 import pandas as pd
 import tkinter as tk
 from tkinter import ttk
+import file_helper
+
+# Buffer size for reading and rewriting the CSV (1 MiB)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Characters that make csv.writer quote a field (with its default dialect)
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
 
 class TaskManager:
     """Manages task functionality for the Z application."""
@@ -23,6 +31,18 @@ class TaskManager:
         """
         self.app = app
         
+        # Command prefixes, looked up once rather than on every Enter press
+        self._command_prefixes = (
+            self.app.config.get("SLASH_PREFIX", "/"),
+            self.app.config.get("TOKEN_PREFIX", "$")
+        )
+        
+        # Set once the CSV is known to have the task and completed columns
+        self._columns_verified = False
+        
+        # Columns after completed (e.g. metadata), left empty in the rows written here
+        self._extra_columns = 0
+        
         # Ensure task column exists in the CSV
         self.ensure_columns()
         
@@ -39,8 +59,16 @@ class TaskManager:
             if not os.path.exists(self.app.data_manager.csv_filename):
                 return
             
+            # Nothing to do if the header hasn't changed since the columns were last fixed up
+            if self.schema_unchanged():
+                with open(self.app.data_manager.csv_filename, 'r', newline='', encoding='utf-8') as f:
+                    self._extra_columns = max(len(next(csv.reader(f), [])) - 4, 0)
+                self._columns_verified = True
+                return
+            
             # Read the CSV file
-            df = pd.read_csv(self.app.data_manager.csv_filename)
+            with open(self.app.data_manager.csv_filename, 'rb', buffering=CSV_BUFFER_SIZE) as f:
+                df = pd.read_csv(f)
             
             # Check if 'task' column exists
             if 'task' not in df.columns:
@@ -55,20 +83,44 @@ class TaskManager:
                 self.app.error_handler.log_info("Added 'completed' column to CSV file")
             
             # If there are existing float values, convert them to integers for storage efficiency
-            if 'task' in df.columns:
-                # Convert NaN to None, floats to integers
-                df['task'] = df['task'].apply(lambda x: int(x) if pd.notnull(x) else None)
-            
-            if 'completed' in df.columns:
-                # Convert NaN to None, floats to integers
-                df['completed'] = df['completed'].apply(lambda x: int(x) if pd.notnull(x) else None)
+            # Cast the whole column at once to nullable Int8 (missing values are written as an
+            # empty field), but only when every flag is 0 or 1 - other values are left as they are
+            for column in ('task', 'completed'):
+                values = pd.to_numeric(df[column], errors='coerce')
+                if values.isna().equals(df[column].isna()) and values.dropna().isin((0, 1)).all():
+                    df[column] = values.astype('Int8')
+                else:
+                    self.app.error_handler.log_warning(f"'{column}' column has values other than 0 and 1; left unchanged")
             
             # Write back to CSV if changes were made
-            df.to_csv(self.app.data_manager.csv_filename, index=False)
+            with open(self.app.data_manager.csv_filename, 'w', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as f:
+                df.to_csv(f, index=False)
+            self._extra_columns = max(len(df.columns) - 4, 0)
+            self._columns_verified = True
+            self.mark_schema_ok()
                 
         except Exception as e:
             self.app.error_handler.log_error(f"Error ensuring columns: {e}")
     
+    def schema_unchanged(self):
+        """
+        Check whether the CSV still has the header its columns were last fixed up with.
+        
+        Rows appended since then don't need fixing up - the task readers coerce
+        whatever flag values they find.
+        
+        Returns:
+            bool: True if the sentinel matches the CSV's header
+        """
+        return file_helper.schema_matches(self.app.data_manager.csv_filename)
+    
+    def mark_schema_ok(self):
+        """Record the CSV file's header in the sentinel."""
+        try:
+            file_helper.mark_schema(self.app.data_manager.csv_filename)
+        except OSError as e:
+            self.app.error_handler.log_error(f"Error writing schema sentinel: {e}")
+    
     def add_task_controls(self):
         """Add task and completed controls to the GUI."""
         # Create a frame for the task elements
@@ -123,10 +175,7 @@ class TaskManager:
             return
         
         # Check if this is a command - if so, let the normal handler deal with it
-        slash_prefix = self.app.config.get("SLASH_PREFIX", "/")
-        token_prefix = self.app.config.get("TOKEN_PREFIX", "$")
-        
-        if input_text.startswith(slash_prefix) or input_text.startswith(token_prefix):
+        if input_text.startswith(self._command_prefixes):
             # Don't interrupt command processing
             return
         
@@ -159,6 +208,11 @@ class TaskManager:
         # Write directly to CSV
         self.write_to_csv(timestamp, input_text, task_value, completed_value)
         
+        # Show a new task without waiting for the next auto-refresh
+        task_list_display = getattr(self.app, 'task_list_display', None)
+        if task_list_display and task_value == 1:
+            task_list_display.refresh_soon()
+        
         # Clear input
         self.app.gui_manager.clear_input()
         
@@ -188,30 +242,42 @@ class TaskManager:
                 with open(self.app.data_manager.csv_filename, 'w', newline='') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(['timestamp', 'text', 'task', 'completed'])
+                self._columns_verified = True
+                self.mark_schema_ok()
             
-            # Ensure our columns exist
-            try:
-                df = pd.read_csv(self.app.data_manager.csv_filename)
-                columns_changed = False
-                
-                if 'task' not in df.columns:
-                    df['task'] = None
-                    columns_changed = True
-                
-                if 'completed' not in df.columns:
-                    df['completed'] = None
-                    columns_changed = True
-                
-                if columns_changed:
-                    df.to_csv(self.app.data_manager.csv_filename, index=False)
+            # Ensure our columns exist - only until they have been checked once,
+            # so a normal submission is a single append
+            if not self._columns_verified:
+                try:
+                    with open(self.app.data_manager.csv_filename, 'rb', buffering=CSV_BUFFER_SIZE) as f:
+                        df = pd.read_csv(f)
+                    columns_changed = False
                     
-            except Exception as e:
-                self.app.error_handler.log_error(f"Error checking columns: {e}")
+                    if 'task' not in df.columns:
+                        df['task'] = None
+                        columns_changed = True
+                    
+                    if 'completed' not in df.columns:
+                        df['completed'] = None
+                        columns_changed = True
+                    
+                    if columns_changed:
+                        with open(self.app.data_manager.csv_filename, 'w', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as f:
+                            df.to_csv(f, index=False)
+                    self._extra_columns = max(len(df.columns) - 4, 0)
+                    self._columns_verified = True
+                        
+                except Exception as e:
+                    self.app.error_handler.log_error(f"Error checking columns: {e}")
             
-            # Now write our row with integer values
+            # Now write our row with integer values, and any further columns left empty
             with open(self.app.data_manager.csv_filename, 'a', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow([timestamp, text, int(task_value), int(completed_value)])
+                if _NEEDS_QUOTING.search(timestamp) or _NEEDS_QUOTING.search(text):
+                    writer = csv.writer(csvfile)
+                    writer.writerow([timestamp, text, int(task_value), int(completed_value)] + [''] * self._extra_columns)
+                else:
+                    # Nothing to quote - write the line csv.writer would produce directly
+                    csvfile.write(f"{timestamp},{text},{int(task_value)},{int(completed_value)}{',' * self._extra_columns}\r\n")
                 
             self.app.error_handler.log_info(f"Added entry with task={task_value}, completed={completed_value}")
         
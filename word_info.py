@@ -11,12 +11,162 @@ Collects and manages information about words including:
 import os
 import re
 import json
-import tkinter as tk
-from tkinter import ttk, messagebox
+import string
+import heapq
+import hashlib
 import threading
 import time
 
 
+# orjson is optional - it parses and serializes the word data several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional - with it a large word file is parsed incrementally instead of
+# being read into memory whole before parsing
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# msgpack is optional - with it a binary snapshot of the parsed word file is kept
+# next to it, so startup can skip parsing JSON that hasn't changed
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Word files larger than this are streamed through ijson when it is available (bytes)
+WORDS_STREAM_THRESHOLD = 1 << 20
+
+# Size at which the append-only word log is folded back into the JSON file (bytes)
+WORDS_LOG_COMPACT_SIZE = 256 * 1024
+
+# Separator of the comma-separated lists in the word editor, with the spaces around it
+_LIST_SEPARATOR = re.compile(r'\s*,\s*')
+
+# Delay before changed words are written, so a burst of adds is saved in one write (seconds)
+WORDS_FLUSH_DELAY = 1.0
+
+
+def loads_json(data):
+    """
+    Parse JSON from bytes.
+    
+    Args:
+        data (bytes): UTF-8 encoded JSON
+        
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(obj, pretty=False):
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: Object to serialize
+        pretty (bool): Indent and sort keys for the human-readable file
+        
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Mock word data for the common words the demonstration lookup knows about
+MOCK_SYNONYMS = {
+    "happy": ["joyful", "cheerful", "content", "pleased", "delighted"],
+    "sad": ["unhappy", "sorrowful", "dejected", "gloomy", "downcast"],
+    "big": ["large", "huge", "enormous", "substantial", "great"],
+    "small": ["little", "tiny", "miniature", "compact", "diminutive"],
+    "fast": ["quick", "speedy", "swift", "rapid", "hasty"],
+    "slow": ["sluggish", "leisurely", "unhurried", "gradual", "plodding"],
+    "good": ["excellent", "fine", "superior", "quality", "satisfactory"],
+    "bad": ["poor", "inferior", "substandard", "inadequate", "deficient"],
+    "hot": ["warm", "boiling", "scorching", "burning", "fiery"],
+    "cold": ["cool", "chilly", "frigid", "icy", "frosty"]
+}
+
+MOCK_ANTONYMS = {
+    "happy": ["sad", "unhappy", "miserable", "depressed", "gloomy"],
+    "sad": ["happy", "joyful", "cheerful", "glad", "delighted"],
+    "big": ["small", "little", "tiny", "compact", "miniature"],
+    "small": ["big", "large", "huge", "enormous", "gigantic"],
+    "fast": ["slow", "sluggish", "leisurely", "unhurried", "gradual"],
+    "slow": ["fast", "quick", "speedy", "swift", "rapid"],
+    "good": ["bad", "poor", "inferior", "substandard", "inadequate"],
+    "bad": ["good", "excellent", "superior", "quality", "fine"],
+    "hot": ["cold", "cool", "chilly", "freezing", "icy"],
+    "cold": ["hot", "warm", "heated", "boiling", "burning"]
+}
+
+MOCK_DEFINITIONS = {
+    "happy": [
+        "Feeling or showing pleasure or contentment.",
+        "Fortunate and convenient."
+    ],
+    "sad": [
+        "Feeling or showing sorrow; unhappy.",
+        "Causing or characterized by sorrow or regret."
+    ],
+    "big": [
+        "Of considerable size, extent, or intensity.",
+        "Of considerable importance or seriousness."
+    ],
+    "small": [
+        "Of a size that is less than normal or usual.",
+        "Limited in quantity."
+    ],
+    "fast": [
+        "Moving or capable of moving at high speed.",
+        "Firm or fixed in position."
+    ],
+    "slow": [
+        "Moving or operating at a low speed.",
+        "Taking a long time to perform a specified action."
+    ],
+    "good": [
+        "To be desired or approved of.",
+        "Having the qualities required for a particular role."
+    ],
+    "bad": [
+        "Of poor quality or a low standard.",
+        "Not such as to be hoped for or desired; unpleasant or unwelcome."
+    ],
+    "hot": [
+        "Having a high degree of heat or a high temperature.",
+        "Spicy or pungent in taste."
+    ],
+    "cold": [
+        "Of or at a low or relatively low temperature.",
+        "Lacking affection or warmth of feeling; unemotional."
+    ]
+}
+
+MOCK_ETYMOLOGIES = {
+    "happy": "From Middle English happy, from hap (chance, fortune) + -y (suffix forming adjectives).",
+    "sad": "From Old English sæd (sated, tired), from Proto-Germanic *sadaz.",
+    "big": "Possibly from Norwegian dialect bugge (important man).",
+    "small": "From Old English smæl, from Proto-Germanic *smalaz.",
+    "fast": "From Old English fæst (firmly fixed, steadfast), from Proto-Germanic *fastuz.",
+    "slow": "From Old English slaw, from Proto-Germanic *slæwaz.",
+    "good": "From Old English gōd, from Proto-Germanic *gōdaz.",
+    "bad": "Origin uncertain, possibly from Old English bæddel (hermaphrodite).",
+    "hot": "From Old English hāt, from Proto-Germanic *haitaz.",
+    "cold": "From Old English cald, ceald, from Proto-Germanic *kaldaz."
+}
+
+
 class WordInfoCollector:
     """
     Module for collecting word information in the Z application.
@@ -37,9 +187,41 @@ class WordInfoCollector:
         # File to store word information
         self.words_file = os.path.join(self.script_dir, "word_info.json")
         
+        # Words added since the JSON file was last written, one JSON object per line
+        self.words_log = os.path.join(self.script_dir, "word_info.jsonl")
+        
+        # Binary snapshot of the JSON file (needs msgpack)
+        self.words_snapshot = os.path.join(self.script_dir, "word_info.msgpack")
+        
+        # Digest of the JSON last written by compact_word_data, to skip identical rewrites
+        self._saved_digest = None
+        
         # Initialize word data
         self.word_data = self.load_word_data()
         
+        # Trigram -> words containing it, for substring searches in /words, and
+        # character -> words containing it for patterns too short for trigrams
+        self._trigrams = {}
+        self._chars = {}
+        for word in self.word_data:
+            self.index_word(word)
+        
+        # Formatted /word output, dropped whenever the word's data changes
+        self._format_cache = {}
+        
+        # Words being looked up in the background, so a repeated /word doesn't start another lookup
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+        
+        # Lookup threads and the editor can save at the same time
+        self._save_lock = threading.RLock()
+        
+        # Words changed since the last write, flushed together by a background thread
+        self._unsaved = {}
+        self._dirty = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        
         # Add word info commands to command handler
         if hasattr(app, 'command_handler') and app.command_handler:
             app.command_handler.slash_commands['word'] = self.cmd_word
@@ -47,29 +229,191 @@ class WordInfoCollector:
     
     def load_word_data(self):
         """
-        Load word information from JSON file.
+        Load word information from the JSON file and replay the word log on top.
         
         Returns:
             dict: Word information dictionary
         """
+        word_data = {}
+        
         if os.path.exists(self.words_file):
             try:
-                with open(self.words_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                st = os.stat(self.words_file)
+                key = [st.st_mtime_ns, st.st_size]
+                
+                snapshot = self.read_snapshot(key)
+                if snapshot is not None:
+                    word_data = snapshot
+                else:
+                    with open(self.words_file, 'rb') as f:
+                        if ijson is not None and st.st_size > WORDS_STREAM_THRESHOLD:
+                            word_data = dict(ijson.kvitems(f, '', use_float=True))
+                        else:
+                            word_data = loads_json(f.read())
+                    self.write_snapshot(word_data, key)
             except Exception as e:
                 self.app.error_handler.log_error(f"Error loading word data: {e}")
         
-        # Return an empty dict if file doesn't exist or loading fails
-        return {}
+        # Later entries win, so a word saved twice ends up with its latest data
+        if os.path.exists(self.words_log):
+            try:
+                with open(self.words_log, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = loads_json(line)
+                        except ValueError:
+                            # Skip a line left incomplete by an interrupted write
+                            continue
+                        word_data[entry["w"]] = entry["d"]
+            except Exception as e:
+                self.app.error_handler.log_error(f"Error loading word log: {e}")
+        
+        return word_data
     
-    def save_word_data(self):
-        """Save word information to JSON file"""
+    def read_snapshot(self, key):
+        """
+        Load the binary snapshot of the JSON file, if it was taken of the file as it is now.
+        
+        Args:
+            key (list): [mtime_ns, size] of the JSON file
+            
+        Returns:
+            dict: Word information, or None if there is no up-to-date snapshot
+        """
+        if msgpack is None or not os.path.exists(self.words_snapshot):
+            return None
+        
         try:
-            with open(self.words_file, 'w', encoding='utf-8') as f:
-                json.dump(self.word_data, f, indent=4, sort_keys=True)
+            with open(self.words_snapshot, 'rb') as f:
+                snapshot = msgpack.unpackb(f.read(), raw=False)
+            if snapshot.get("key") != key:
+                return None
+            return snapshot["words"]
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error reading word snapshot: {e}")
+            return None
+    
+    def write_snapshot(self, word_data, key):
+        """
+        Save a binary snapshot of the JSON file.
+        
+        Args:
+            word_data (dict): Word information read from the JSON file
+            key (list): [mtime_ns, size] of the JSON file
+        """
+        if msgpack is None:
+            return
+        
+        try:
+            # Write to a temp file and swap it in so readers never see a partial snapshot
+            tmp_path = self.words_snapshot + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(msgpack.packb({"key": key, "words": word_data}, use_bin_type=True))
+            os.replace(tmp_path, self.words_snapshot)
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error writing word snapshot: {e}")
+    
+    def save_word_data(self, word):
+        """
+        Queue a word's information to be appended to the word log.
+        
+        Args:
+            word (str): The word whose data changed
+        """
+        with self._save_lock:
+            self._unsaved[word] = None
+        self._dirty.set()
+    
+    def _flush_loop(self):
+        """Write queued words shortly after they change. Runs in a background thread."""
+        while True:
+            self._dirty.wait()
+            time.sleep(WORDS_FLUSH_DELAY)
+            self.flush_word_data()
+    
+    def flush_word_data(self):
+        """Append all queued words to the word log in one write."""
+        try:
+            with self._save_lock:
+                self._dirty.clear()
+                if not self._unsaved:
+                    return
+                
+                entries = b"".join(dumps_json({"w": word, "d": self.word_data[word]}) + b"\n" for word in self._unsaved)
+                self._unsaved.clear()
+                with open(self.words_log, 'ab') as f:
+                    f.write(entries)
+                    size = f.tell()
+                
+                # Fold the log into the JSON file once it has grown
+                if size > WORDS_LOG_COMPACT_SIZE:
+                    self.compact_word_data()
         except Exception as e:
             self.app.error_handler.log_error(f"Error saving word data: {e}")
     
+    def compact_word_data(self):
+        """Rewrite the JSON file from the current word data and clear the word log."""
+        try:
+            with self._save_lock:
+                payload = dumps_json(self.word_data, pretty=True)
+                digest = hashlib.blake2b(payload, digest_size=16).digest()
+                
+                # Skip the rewrite if the log only repeated data the file already has
+                if digest != self._saved_digest:
+                    # Write to a temp file and swap it in so a crash never leaves a truncated
+                    # file; sync it first so the rename can't land before the data does
+                    tmp_path = self.words_file + ".tmp"
+                    with open(tmp_path, 'wb') as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.words_file)
+                    self._saved_digest = digest
+                    
+                    st = os.stat(self.words_file)
+                    self.write_snapshot(self.word_data, [st.st_mtime_ns, st.st_size])
+                
+                if os.path.exists(self.words_log):
+                    os.remove(self.words_log)
+        except Exception as e:
+            self.app.error_handler.log_error(f"Error compacting word data: {e}")
+    
+    def index_word(self, word):
+        """
+        Add a word to the trigram and character indexes.
+        
+        Args:
+            word (str): The word to index
+        """
+        for i in range(len(word) - 2):
+            self._trigrams.setdefault(word[i:i + 3], set()).add(word)
+        for char in set(word):
+            self._chars.setdefault(char, set()).add(word)
+    
+    def search_words(self, pattern):
+        """
+        Find the words containing a pattern.
+        
+        Args:
+            pattern (str): Substring to search for
+            
+        Returns:
+            list: Matching words
+        """
+        if not pattern:
+            return list(self.word_data)
+        
+        # Every match contains all of the pattern's trigrams (or, for patterns shorter
+        # than a trigram, its characters) - intersect their postings, smallest first,
+        # then confirm the candidates
+        if len(pattern) < 3:
+            keys = [self._chars.get(char, set()) for char in set(pattern)]
+        else:
+            keys = [self._trigrams.get(pattern[i:i + 3], set()) for i in range(len(pattern) - 2)]
+        postings = sorted(keys, key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [word for word in candidates if pattern in word]
+    
     def cmd_word(self, args):
         """
         Command to look up or add word information.
@@ -85,7 +429,11 @@ class WordInfoCollector:
         
         # Get the word (first argument) and any options
         parts = args.strip().split(None, 1)
-        word = parts[0].lower()
+        word = parts[0]
+        
+        # Words are stored lowercase; most lookups are typed that way already
+        if not word.islower():
+            word = word.lower()
         options = parts[1] if len(parts) > 1 else ""
         
         # Check if the word exists in our data
@@ -93,7 +441,12 @@ class WordInfoCollector:
             # Word exists, show its information
             return self.format_word_info(word)
         else:
-            # Word doesn't exist, start a background lookup
+            # Word doesn't exist, start a background lookup unless one is already running
+            with self._inflight_lock:
+                if word in self._inflight:
+                    return f"Already looking up '{word}'..."
+                self._inflight.add(word)
+            
             self.app.gui_manager.set_feedback(f"Looking up information for '{word}'...")
             
             # Start a background thread to fetch word information
@@ -123,13 +476,13 @@ class WordInfoCollector:
         # If args provided, use as search pattern
         if args:
             pattern = args.lower()
-            matching_words = [word for word in self.word_data if pattern in word]
+            matching_words = self.search_words(pattern)
             
             if not matching_words:
                 return f"No words found matching '{pattern}'."
                 
             word_count = len(matching_words)
-            words_list = ", ".join(sorted(matching_words)[:20])
+            words_list = ", ".join(heapq.nsmallest(20, matching_words))
             
             if word_count > 20:
                 return f"Found {word_count} words matching '{pattern}' (showing first 20):\n{words_list}"
@@ -138,7 +491,7 @@ class WordInfoCollector:
         
         # No args, list all words
         word_count = len(self.word_data)
-        words_list = ", ".join(sorted(self.word_data.keys())[:20])
+        words_list = ", ".join(heapq.nsmallest(20, self.word_data))
         
         if word_count > 20:
             return f"Word database contains {word_count} words (showing first 20):\n{words_list}"
@@ -153,48 +506,56 @@ class WordInfoCollector:
         Args:
             word (str): The word to look up
         """
-        word_info = {
-            "synonyms": [],
-            "antonyms": [],
-            "definitions": [],
-            "etymology": ""
-        }
-        
-        success = False
-        
         try:
-            # Try to fetch from a dictionary API
-            # For this example, we'll use a mock implementation
-            # In a real implementation, you would use actual API calls
+            word_info = {
+                "synonyms": [],
+                "antonyms": [],
+                "definitions": [],
+                "etymology": ""
+            }
             
-            # Simulate API delay
-            time.sleep(1.5)
+            success = False
             
-            # Mock data for demonstration
-            if len(word) > 2:  # Simple check to avoid very short words
-                success = True
+            try:
+                # Try to fetch from a dictionary API
+                # For this example, we'll use a mock implementation
+                # In a real implementation, you would use actual API calls
                 
-                # Simulate data based on the word
-                word_info["synonyms"] = self.mock_synonyms(word)
-                word_info["antonyms"] = self.mock_antonyms(word)
-                word_info["definitions"] = self.mock_definitions(word)
-                word_info["etymology"] = self.mock_etymology(word)
-        
-        except Exception as e:
-            # Update feedback with error
-            self.app.gui_manager.set_feedback(f"Error fetching info for '{word}': {str(e)}")
-            self.app.error_handler.log_error(f"Error fetching word info: {e}")
-            return
-        
-        # If we got any data, save it
-        if success:
-            self.word_data[word] = word_info
-            self.save_word_data()
+                # Simulate API delay
+                time.sleep(1.5)
+                
+                # Mock data for demonstration
+                if len(word) > 2:  # Simple check to avoid very short words
+                    success = True
+                    
+                    # Simulate data based on the word
+                    word_info["synonyms"] = self.mock_synonyms(word)
+                    word_info["antonyms"] = self.mock_antonyms(word)
+                    word_info["definitions"] = self.mock_definitions(word)
+                    word_info["etymology"] = self.mock_etymology(word)
             
-            # Update the feedback with a success message
-            self.app.gui_manager.set_feedback(f"Added information for '{word}'")
-        else:
-            self.app.gui_manager.set_feedback(f"Could not find information for '{word}'")
+            except Exception as e:
+                # Update feedback with error
+                self.app.gui_manager.set_feedback(f"Error fetching info for '{word}': {str(e)}")
+                self.app.error_handler.log_error(f"Error fetching word info: {e}")
+                return
+            
+            # If we got any data, save it
+            if success:
+                # Saving serializes word_data on the flusher thread, so change it under the same lock
+                with self._save_lock:
+                    self.word_data[word] = word_info
+                    self._format_cache.pop(word, None)
+                    self.index_word(word)
+                self.save_word_data(word)
+                
+                # Update the feedback with a success message
+                self.app.gui_manager.set_feedback(f"Added information for '{word}'")
+            else:
+                self.app.gui_manager.set_feedback(f"Could not find information for '{word}'")
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(word)
     
     def format_word_info(self, word):
         """
@@ -209,28 +570,33 @@ class WordInfoCollector:
         if word not in self.word_data:
             return f"No information found for '{word}'."
         
+        cached = self._format_cache.get(word)
+        if cached is not None:
+            return cached
+        
         info = self.word_data[word]
-        result = f"Information for '{word}':\n\n"
+        parts = [f"Information for '{word}':\n\n"]
         
         # Add definitions
         if info["definitions"]:
-            result += "Definitions:\n"
-            for i, definition in enumerate(info["definitions"], 1):
-                result += f"{i}. {definition}\n"
-            result += "\n"
+            parts.append("Definitions:\n")
+            parts.extend(f"{i}. {definition}\n" for i, definition in enumerate(info["definitions"], 1))
+            parts.append("\n")
         
         # Add synonyms
         if info["synonyms"]:
-            result += f"Synonyms: {', '.join(info['synonyms'])}\n\n"
+            parts.append(f"Synonyms: {', '.join(info['synonyms'])}\n\n")
         
         # Add antonyms
         if info["antonyms"]:
-            result += f"Antonyms: {', '.join(info['antonyms'])}\n\n"
+            parts.append(f"Antonyms: {', '.join(info['antonyms'])}\n\n")
         
         # Add etymology
         if info["etymology"]:
-            result += f"Etymology: {info['etymology']}\n"
+            parts.append(f"Etymology: {info['etymology']}\n")
         
+        result = "".join(parts)
+        self._format_cache[word] = result
         return result
     
     def add_word(self, word, data):
@@ -254,10 +620,14 @@ class WordInfoCollector:
                 data[field] = [] if field != "etymology" else ""
         
         # Update the word data
-        self.word_data[word.lower()] = data
+        word = word.lower()
+        with self._save_lock:
+            self.word_data[word] = data
+            self._format_cache.pop(word, None)
+            self.index_word(word)
         
         # Save the updated data
-        self.save_word_data()
+        self.save_word_data(word)
         
         return True
     
@@ -268,6 +638,10 @@ class WordInfoCollector:
         Args:
             word (str, optional): The word to edit, or None to add a new word
         """
+        # Only the editor needs tkinter, so it isn't imported with the module
+        import tkinter as tk
+        from tkinter import ttk, messagebox
+        
         # Create a new toplevel window
         editor = tk.Toplevel(self.app.root)
         editor.title("Word Information Editor")
@@ -337,9 +711,9 @@ class WordInfoCollector:
             
             # Build the data
             word_data = {
-                "synonyms": [s.strip() for s in synonyms_var.get().split(",") if s.strip()],
-                "antonyms": [a.strip() for a in antonyms_var.get().split(",") if a.strip()],
-                "definitions": [d for d in definitions_text.get("1.0", "end-1c").splitlines() if d.strip()],
+                "synonyms": [s for s in _LIST_SEPARATOR.split(synonyms_var.get().strip()) if s],
+                "antonyms": [a for a in _LIST_SEPARATOR.split(antonyms_var.get().strip()) if a],
+                "definitions": [d for d in definitions_text.get("1.0", "end-1c").split("\n") if d.strip()],
                 "etymology": etymology_var.get().strip()
             }
             
@@ -366,47 +740,21 @@ class WordInfoCollector:
     # Mock data methods for demonstration (these would be replaced with real API calls)
     def mock_synonyms(self, word):
         """Generate mock synonyms for demonstration"""
-        word_length = len(word)
-        common_words = ["happy", "sad", "big", "small", "fast", "slow", "good", "bad", "hot", "cold"]
-        
-        if word in common_words:
+        if word in MOCK_SYNONYMS:
             # Return known synonyms for common words
-            synonyms_map = {
-                "happy": ["joyful", "cheerful", "content", "pleased", "delighted"],
-                "sad": ["unhappy", "sorrowful", "dejected", "gloomy", "downcast"],
-                "big": ["large", "huge", "enormous", "substantial", "great"],
-                "small": ["little", "tiny", "miniature", "compact", "diminutive"],
-                "fast": ["quick", "speedy", "swift", "rapid", "hasty"],
-                "slow": ["sluggish", "leisurely", "unhurried", "gradual", "plodding"],
-                "good": ["excellent", "fine", "superior", "quality", "satisfactory"],
-                "bad": ["poor", "inferior", "substandard", "inadequate", "deficient"],
-                "hot": ["warm", "boiling", "scorching", "burning", "fiery"],
-                "cold": ["cool", "chilly", "frigid", "icy", "frosty"]
-            }
-            return synonyms_map.get(word, [])
+            return list(MOCK_SYNONYMS[word])
         
-        # Generate random synonyms based on word characteristics
-        return [f"{word[0]}{word[1:]}{chr(97 + (ord(word[0]) - 97 + i) % 26)}" for i in range(min(5, word_length))]
+        # Generate random synonyms based on word characteristics - the word plus each
+        # of the next few letters of the alphabet, starting from its first letter
+        start = (ord(word[0]) - 97) % 26
+        letters = string.ascii_lowercase[start:] + string.ascii_lowercase[:start]
+        return [word + letter for letter in letters[:min(5, len(word))]]
     
     def mock_antonyms(self, word):
         """Generate mock antonyms for demonstration"""
-        common_words = ["happy", "sad", "big", "small", "fast", "slow", "good", "bad", "hot", "cold"]
-        
-        if word in common_words:
+        if word in MOCK_ANTONYMS:
             # Return known antonyms for common words
-            antonyms_map = {
-                "happy": ["sad", "unhappy", "miserable", "depressed", "gloomy"],
-                "sad": ["happy", "joyful", "cheerful", "glad", "delighted"],
-                "big": ["small", "little", "tiny", "compact", "miniature"],
-                "small": ["big", "large", "huge", "enormous", "gigantic"],
-                "fast": ["slow", "sluggish", "leisurely", "unhurried", "gradual"],
-                "slow": ["fast", "quick", "speedy", "swift", "rapid"],
-                "good": ["bad", "poor", "inferior", "substandard", "inadequate"],
-                "bad": ["good", "excellent", "superior", "quality", "fine"],
-                "hot": ["cold", "cool", "chilly", "freezing", "icy"],
-                "cold": ["hot", "warm", "heated", "boiling", "burning"]
-            }
-            return antonyms_map.get(word, [])
+            return list(MOCK_ANTONYMS[word])
         
         # Generate a simple opposite by reversing letters or adding "not-"
         if len(word) > 3:
@@ -415,53 +763,9 @@ class WordInfoCollector:
     
     def mock_definitions(self, word):
         """Generate mock definitions for demonstration"""
-        common_words = ["happy", "sad", "big", "small", "fast", "slow", "good", "bad", "hot", "cold"]
-        
-        if word in common_words:
+        if word in MOCK_DEFINITIONS:
             # Return known definitions for common words
-            definitions_map = {
-                "happy": [
-                    "Feeling or showing pleasure or contentment.",
-                    "Fortunate and convenient."
-                ],
-                "sad": [
-                    "Feeling or showing sorrow; unhappy.",
-                    "Causing or characterized by sorrow or regret."
-                ],
-                "big": [
-                    "Of considerable size, extent, or intensity.",
-                    "Of considerable importance or seriousness."
-                ],
-                "small": [
-                    "Of a size that is less than normal or usual.",
-                    "Limited in quantity."
-                ],
-                "fast": [
-                    "Moving or capable of moving at high speed.",
-                    "Firm or fixed in position."
-                ],
-                "slow": [
-                    "Moving or operating at a low speed.",
-                    "Taking a long time to perform a specified action."
-                ],
-                "good": [
-                    "To be desired or approved of.",
-                    "Having the qualities required for a particular role."
-                ],
-                "bad": [
-                    "Of poor quality or a low standard.",
-                    "Not such as to be hoped for or desired; unpleasant or unwelcome."
-                ],
-                "hot": [
-                    "Having a high degree of heat or a high temperature.",
-                    "Spicy or pungent in taste."
-                ],
-                "cold": [
-                    "Of or at a low or relatively low temperature.",
-                    "Lacking affection or warmth of feeling; unemotional."
-                ]
-            }
-            return definitions_map.get(word, [])
+            return list(MOCK_DEFINITIONS[word])
         
         # Generate some placeholder definitions
         return [
@@ -471,23 +775,9 @@ class WordInfoCollector:
     
     def mock_etymology(self, word):
         """Generate mock etymology for demonstration"""
-        common_words = ["happy", "sad", "big", "small", "fast", "slow", "good", "bad", "hot", "cold"]
-        
-        if word in common_words:
+        if word in MOCK_ETYMOLOGIES:
             # Return known etymologies for common words
-            etymology_map = {
-                "happy": "From Middle English happy, from hap (chance, fortune) + -y (suffix forming adjectives).",
-                "sad": "From Old English sæd (sated, tired), from Proto-Germanic *sadaz.",
-                "big": "Possibly from Norwegian dialect bugge (important man).",
-                "small": "From Old English smæl, from Proto-Germanic *smalaz.",
-                "fast": "From Old English fæst (firmly fixed, steadfast), from Proto-Germanic *fastuz.",
-                "slow": "From Old English slaw, from Proto-Germanic *slæwaz.",
-                "good": "From Old English gōd, from Proto-Germanic *gōdaz.",
-                "bad": "Origin uncertain, possibly from Old English bæddel (hermaphrodite).",
-                "hot": "From Old English hāt, from Proto-Germanic *haitaz.",
-                "cold": "From Old English cald, ceald, from Proto-Germanic *kaldaz."
-            }
-            return etymology_map.get(word, "")
+            return MOCK_ETYMOLOGIES[word]
         
         # Generate a simple placeholder etymology
         vowels = "aeiou"